@@ -1,9 +1,20 @@
 """TestCaseDocument pydantic model."""
 import re
 from datetime import datetime
-from typing import Any
+from typing import Annotated, Any
 
-from pydantic import BaseModel, ConfigDict, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, StringConstraints, field_validator
+
+# Markdown heading anywhere in the content (e.g. '# Title')
+MARKDOWN_HEADING_PATTERN = re.compile(r'^#{1,6}\s+.+', re.MULTILINE)
+
+# Branch name in format 'test-cases/issue-{N}' (pattern checked by pydantic-core)
+BranchName = Annotated[str, StringConstraints(pattern=r'^test-cases/issue-\d+$')]
+
+# GitHub PR URL: https://github.com/{owner}/{repo}/pull/{number} (pattern checked by pydantic-core)
+GitHubPrUrl = Annotated[
+    str, StringConstraints(pattern=r'^https://github\.com/[\w-]+/[\w.-]+/pull/\d+$')
+]
 
 
 class TestCaseDocument(BaseModel):
@@ -17,12 +28,16 @@ class TestCaseDocument(BaseModel):
     title: str = Field(..., description="Document title (e.g., 'Test Cases: Feature X')")
     content: str = Field(..., description="Markdown-formatted test case content")
     metadata: dict[str, Any] = Field(..., description="Metadata with issue, generated_at, ai_model, context_sources")
-    branch_name: str = Field(..., description="Git branch name in format 'test-cases/issue-{N}'")
+    branch_name: BranchName = Field(..., description="Git branch name in format 'test-cases/issue-{N}'")
     pr_number: int | None = Field(default=None, gt=0, description="GitHub PR number (if created)")
-    pr_url: str | None = Field(default=None, description="GitHub PR URL (if created)")
+    pr_url: GitHubPrUrl | None = Field(default=None, description="GitHub PR URL (if created)")
     generated_at: datetime = Field(..., description="Timestamp when document was generated")
     ai_model: str = Field(..., description="AI model used for generation (e.g., 'llama-3.2-11b')")
-    context_sources: list[int] = Field(default_factory=list, description="List of similar issue numbers (context)")
+    context_sources: list[int] = Field(
+        default_factory=list,
+        max_length=5,
+        description="List of similar issue numbers (context, top 5 from vector DB)"
+    )
     correlation_id: str = Field(..., description="Correlation ID for tracking (UUID)")
 
     @field_validator("content")
@@ -33,7 +48,7 @@ class TestCaseDocument(BaseModel):
             raise ValueError("content cannot be empty")
 
         # Basic Markdown validation: Must contain at least one heading
-        if not re.search(r'^#{1,6}\s+.+', v, re.MULTILINE):
+        if not MARKDOWN_HEADING_PATTERN.search(v):
             raise ValueError("content must contain at least one Markdown heading (# Title)")
 
         return v
@@ -50,34 +65,6 @@ class TestCaseDocument(BaseModel):
 
         return v
 
-    @field_validator("branch_name")
-    @classmethod
-    def validate_branch_name_pattern(cls, v: str) -> str:
-        """Validate branch_name matches pattern 'test-cases/issue-{issue_number}'."""
-        pattern = r'^test-cases/issue-\d+$'
-        if not re.match(pattern, v):
-            raise ValueError(
-                "branch_name must match pattern 'test-cases/issue-{issue_number}' "
-                f"(e.g., 'test-cases/issue-42'), got: {v}"
-            )
-        return v
-
-    @field_validator("pr_url")
-    @classmethod
-    def validate_pr_url_format(cls, v: str | None, info) -> str | None:
-        """Validate pr_url is a valid GitHub URL if not None."""
-        if v is None:
-            return v
-
-        # GitHub PR URL pattern: https://github.com/{owner}/{repo}/pull/{number}
-        github_pr_pattern = r'^https://github\.com/[\w-]+/[\w.-]+/pull/\d+$'
-        if not re.match(github_pr_pattern, v):
-            raise ValueError(
-                f"pr_url must be a valid GitHub PR URL (https://github.com/owner/repo/pull/123), got: {v}"
-            )
-
-        return v
-
     @field_validator("pr_url")
     @classmethod
     def validate_pr_consistency(cls, v: str | None, info) -> str | None:
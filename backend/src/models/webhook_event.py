@@ -1,8 +1,14 @@
 """WebhookEvent pydantic model."""
 from datetime import datetime
-from typing import Literal
+from typing import Annotated, Literal
 
-from pydantic import BaseModel, ConfigDict, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, StringConstraints, field_validator
+
+# Repository full name in 'owner/repo' format (pattern checked by pydantic-core)
+RepositoryName = Annotated[str, StringConstraints(pattern=r'^[^/]+/[^/]+$')]
+
+# HMAC-SHA256 signature with GitHub's 'sha256=' prefix (pattern checked by pydantic-core)
+Signature = Annotated[str, StringConstraints(pattern=r'^sha256=')]
 
 
 class WebhookEvent(BaseModel):
@@ -40,8 +46,8 @@ class WebhookEvent(BaseModel):
         description="Issue body content (truncated to 5000 chars)"
     )
     labels: list[str] = Field(..., min_length=1, description="Issue labels")
-    repository: str = Field(..., description="Repository name (owner/repo)")
-    signature: str = Field(..., description="HMAC-SHA256 signature")
+    repository: RepositoryName = Field(..., description="Repository name (owner/repo)")
+    signature: Signature = Field(..., description="HMAC-SHA256 signature")
     received_at: datetime = Field(..., description="Webhook received timestamp")
     correlation_id: str = Field(..., description="Correlation ID (UUID)")
 
@@ -62,28 +68,3 @@ class WebhookEvent(BaseModel):
                 "Labels must contain 'generate-tests' tag (FR-002)"
             )
         return v
-
-    @field_validator("signature")
-    @classmethod
-    def validate_signature_format(cls, v: str) -> str:
-        """Validate signature has 'sha256=' prefix."""
-        if not v.startswith("sha256="):
-            raise ValueError(
-                "Signature must have 'sha256=' prefix for HMAC-SHA256 validation"
-            )
-        return v
-
-    @field_validator("repository")
-    @classmethod
-    def validate_repository_format(cls, v: str) -> str:
-        """Validate repository format is 'owner/repo'."""
-        if "/" not in v or v.count("/") != 1:
-            raise ValueError(
-                "Repository must be in 'owner/repo' format"
-            )
-        owner, repo = v.split("/")
-        if not owner or not repo:
-            raise ValueError(
-                "Repository owner and name cannot be empty"
-            )
-        return v
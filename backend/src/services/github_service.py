@@ -23,6 +23,13 @@ class GitHubService:
         self.github_client = github_client
         self.config = config
         self.repo_name = getattr(config, 'GITHUB_REPO', 'owner/repo')
+        self._repo = None
+
+        # Bind service-wide fields once; per-call binds only add operation fields
+        self.log = logger.bind(
+            service="GitHubService",
+            repository=self.repo_name
+        )
 
     async def create_branch(
         self,
@@ -40,11 +47,10 @@ class GitHubService:
             GitHubAPIError: If API request fails (E406)
             GitHubRateLimitError: If rate limit exceeded (E405)
         """
-        log = logger.bind(
+        log = self.log.bind(
             operation="create_branch",
             branch_name=branch_name,
-            base_branch=base_branch,
-            repository=self.repo_name
+            base_branch=base_branch
         )
 
         log.info("github_create_branch_started")
@@ -124,11 +130,10 @@ class GitHubService:
         Raises:
             GitHubAPIError: If API request fails (E406)
         """
-        log = logger.bind(
+        log = self.log.bind(
             operation="create_pr",
             head_branch=head_branch,
-            base_branch=base_branch,
-            repository=self.repo_name
+            base_branch=base_branch
         )
 
         log.info(
@@ -207,10 +212,9 @@ class GitHubService:
         Raises:
             GitHubAPIError: If API request fails (E406)
         """
-        log = logger.bind(
+        log = self.log.bind(
             operation="add_comment",
-            issue_number=issue_number,
-            repository=self.repo_name
+            issue_number=issue_number
         )
 
         log.info(
@@ -237,6 +241,51 @@ class GitHubService:
                 details={"issue_number": issue_number, "error": str(e)}
             )
 
+    async def commit_and_comment(
+        self,
+        file_path: str,
+        content: str,
+        branch_name: str,
+        commit_message: str,
+        issue_number: int,
+        comment: str
+    ) -> None:
+        """Commit a file and comment on its issue concurrently.
+
+        The commit and the issue comment are independent once the branch
+        exists, so both requests are issued together to overlap API latency.
+        If either request fails, the other is cancelled. A request GitHub has
+        already accepted cannot be undone, so a comment may still be posted
+        when the commit fails (and vice versa).
+
+        Args:
+            file_path: Path to the file in the repository
+            content: File content to commit
+            branch_name: Branch to commit to (must already exist)
+            commit_message: Commit message
+            issue_number: Issue number to comment on
+            comment: Comment text
+
+        Raises:
+            GitHubAPIError: If either API request fails (E406)
+        """
+        try:
+            async with asyncio.TaskGroup() as tg:
+                tg.create_task(self.commit_file(
+                    file_path=file_path,
+                    content=content,
+                    branch_name=branch_name,
+                    commit_message=commit_message
+                ))
+                tg.create_task(self.add_comment(
+                    issue_number=issue_number,
+                    comment=comment
+                ))
+        except ExceptionGroup as eg:
+            # Surface the first failure so callers see a GitHubAPIError; the full
+            # group (including any second failure) stays attached as __cause__
+            raise eg.exceptions[0] from eg
+
     async def create_branch_with_retry(
         self,
         branch_name: str,
@@ -278,7 +327,8 @@ class GitHubService:
         if last_error:
             raise last_error
 
-    def generate_branch_name(self, issue_number: int) -> str:
+    @staticmethod
+    def generate_branch_name(issue_number: int) -> str:
         """Generate branch name for an issue.
 
         Args:
@@ -289,7 +339,8 @@ class GitHubService:
         """
         return f"test-cases/issue-{issue_number}"
 
-    def generate_file_path(self, issue_number: int) -> str:
+    @staticmethod
+    def generate_file_path(issue_number: int) -> str:
         """Generate file path for test case document.
 
         Args:
@@ -300,7 +351,8 @@ class GitHubService:
         """
         return f"test-cases/issue-{issue_number}.md"
 
-    def generate_commit_message(self, issue_number: int) -> str:
+    @staticmethod
+    def generate_commit_message(issue_number: int) -> str:
         """Generate commit message for test case commit.
 
         Args:
@@ -340,6 +392,16 @@ class GitHubService:
 
         return body
 
+    def _get_repo(self):
+        """Get the repository object, fetching it once and caching it.
+
+        Returns:
+            Repository object from the GitHub client
+        """
+        if self._repo is None:
+            self._repo = self.github_client.get_repo(self.repo_name)
+        return self._repo
+
     def get_default_branch(self) -> str:
         """Get the repository's default branch.
 
@@ -347,9 +409,8 @@ class GitHubService:
             Default branch name (usually 'main' or 'master')
         """
         try:
-            repo = self.github_client.get_repo()
-            return repo.default_branch
-        except:
+            return self._get_repo().default_branch
+        except Exception:
             # Fallback to 'main' if we can't get repo info
             return "main"
 
@@ -360,7 +421,7 @@ class GitHubService:
             True if token has push and pull permissions
         """
         try:
-            repo = self.github_client.get_repo()
+            repo = self._get_repo()
             return repo.permissions.push and repo.permissions.pull
-        except:
+        except Exception:
             return False
@@ -2,7 +2,10 @@
 import hashlib
 import hmac
 import json
+import re
+import time
 import uuid
+from collections import OrderedDict
 from datetime import datetime
 from typing import Literal
 
@@ -13,6 +16,13 @@ from src.core.exceptions import (
 )
 from src.models.webhook_event import WebhookEvent
 
+# GitHub signature header: 'sha256=' followed by a 64-char lowercase hex digest
+SIGNATURE_PATTERN = re.compile(r"sha256=([0-9a-f]{64})")
+
+# In-process cache of recently seen idempotency keys (short-circuits Redis on redeliveries)
+SEEN_KEYS_MAX_SIZE = 10_000
+SEEN_KEYS_TTL_SECONDS = 300
+
 
 class WebhookService:
     """Service for validating and processing GitHub webhook events."""
@@ -27,6 +37,24 @@ class WebhookService:
         self.redis_client = redis_client
         self.config = config
         self.webhook_secret = config.github_webhook_secret
+        self._seen_keys: OrderedDict[str, float] = OrderedDict()
+
+    def _is_recently_seen(self, idempotency_key: str) -> bool:
+        """Check the in-process cache for an unexpired idempotency key."""
+        expires_at = self._seen_keys.get(idempotency_key)
+        if expires_at is None:
+            return False
+        if expires_at <= time.monotonic():
+            del self._seen_keys[idempotency_key]
+            return False
+        return True
+
+    def _remember_key(self, idempotency_key: str) -> None:
+        """Record an idempotency key in the in-process cache, evicting the oldest."""
+        self._seen_keys[idempotency_key] = time.monotonic() + SEEN_KEYS_TTL_SECONDS
+        self._seen_keys.move_to_end(idempotency_key)
+        if len(self._seen_keys) > SEEN_KEYS_MAX_SIZE:
+            self._seen_keys.popitem(last=False)
 
     def validate_signature(self, payload: bytes, signature: str | None) -> bool:
         """Validate HMAC-SHA256 signature from GitHub webhook.
@@ -47,15 +75,15 @@ class WebhookService:
                 received="None"
             )
 
-        # Validate signature format
-        if not signature.startswith("sha256="):
+        # Validate signature format and extract hash in one step
+        match = SIGNATURE_PATTERN.fullmatch(signature)
+        if not match:
             raise InvalidWebhookSignatureError(
                 expected="sha256=...",
                 received=signature
             )
 
-        # Extract hash from signature
-        received_hash = signature[7:]  # Remove 'sha256=' prefix
+        received_hash = match.group(1)
 
         # Calculate expected signature
         expected_signature = hmac.new(
@@ -122,8 +150,14 @@ class WebhookService:
             issue_body = issue.get("body", "")
             repository = payload_dict["repository"]["full_name"]
 
-            # Extract labels
-            labels = [label["name"] for label in issue.get("labels", [])]
+            # Extract labels, checking for the trigger label in the same pass
+            labels = []
+            has_trigger_label = False
+            for label in issue.get("labels") or []:
+                name = label["name"]
+                labels.append(name)
+                if name == "generate-tests":
+                    has_trigger_label = True
 
         except (KeyError, TypeError) as e:
             raise InvalidWebhookPayloadError(
@@ -132,7 +166,7 @@ class WebhookService:
             )
 
         # Step 5: Validate generate-tests label is present (FR-002)
-        if "generate-tests" not in labels:
+        if not has_trigger_label:
             raise InvalidWebhookPayloadError(
                 message="Missing required label 'generate-tests' (FR-002)",
                 error_code="E103"
@@ -142,9 +176,15 @@ class WebhookService:
         key_string = f"{repository}-{issue_number}"
         idempotency_key = hashlib.sha256(key_string.encode('utf-8')).hexdigest()
 
-        # Step 7: Check for duplicate webhook (idempotency)
+        # Step 7: Check for duplicate webhook (idempotency), in-process cache first
+        if self._is_recently_seen(idempotency_key):
+            raise DuplicateWebhookError(
+                idempotency_key=idempotency_key
+            )
+
         is_duplicate = await self.redis_client.exists(f"webhook:{idempotency_key}")
         if is_duplicate:
+            self._remember_key(idempotency_key)
             raise DuplicateWebhookError(
                 idempotency_key=idempotency_key
             )
@@ -155,8 +195,10 @@ class WebhookService:
             "processed",
             3600  # 1 hour
         )
+        self._remember_key(idempotency_key)
 
-        # Step 9: Generate correlation ID and event ID
+        # Step 9: Generate correlation ID and event ID (canonical dashed UUIDs, as
+        # declared in the API spec and used for job_id)
         correlation_id = str(uuid.uuid4())
         event_id = str(uuid.uuid4())
 
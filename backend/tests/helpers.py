@@ -0,0 +1,35 @@
+"""Shared helpers for the backend test suite."""
+from datetime import datetime
+
+# Fixed clock reading shared by every test that needs a deterministic timestamp
+FROZEN_NOW = datetime(2025, 1, 15, 10, 30, 0)
+
+
+def async_return(value=None):
+    """Build a lightweight coroutine function that ignores its arguments.
+
+    Args:
+        value: Value every call returns
+
+    Returns:
+        Async function usable in place of an AsyncMock that is never inspected
+    """
+    async def call(*args, **kwargs):
+        return value
+
+    return call
+
+
+def async_raise(error):
+    """Build a lightweight coroutine function that always raises.
+
+    Args:
+        error: Exception every call raises
+
+    Returns:
+        Async function usable in place of an AsyncMock side_effect that is never inspected
+    """
+    async def call(*args, **kwargs):
+        raise error
+
+    return call
@@ -3,51 +3,101 @@ import asyncio
 import hashlib
 import hmac
 import json
+import os
+import uuid
 from datetime import datetime
-from unittest.mock import AsyncMock, Mock, patch
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock
 
 import pytest
+import pytest_asyncio
+from httpx import ASGITransport, AsyncClient, Limits
 
+from src.core.config import settings
 from src.main import create_app
 from src.models.processing_job import JobStatus
+from src.services.ai_service import AIService
+from src.services.github_service import GitHubService
+from src.services.webhook_service import WebhookService
+from tests.helpers import async_return
 
+# All tests share the session event loop, and with it the session-scoped client
+pytestmark = pytest.mark.asyncio(loop_scope="session")
 
-class TestEndToEndWorkflow:
-    """Integration tests for complete webhook processing workflow."""
+# Workflow wait budget. All I/O is mocked, so a few seconds is ample; set
+# E2E_MAX_WAIT_S=120 to check against the full FR-010 two-minute budget.
+MAX_WAIT_SECONDS = float(os.getenv("E2E_MAX_WAIT_S", "10"))
 
-    @pytest.fixture
-    async def app(self):
-        """Fixture for FastAPI app instance with initialized state."""
-        from unittest.mock import AsyncMock
+# Job statuses after which the workflow makes no further progress
+TERMINAL_STATUSES = frozenset({JobStatus.COMPLETED, JobStatus.FAILED})
 
-        from src.core.config import settings
-        from src.services.ai_service import AIService
-        from src.services.github_service import GitHubService
-        from src.services.webhook_service import WebhookService
 
-        app = create_app()
+def sign(body: bytes, secret: str) -> str:
+    """Build the X-Hub-Signature-256 header for the exact body bytes sent.
 
-        # Manually initialize state (lifespan doesn't run with httpx test client)
-        app.state.jobs = {}  # In-memory job storage
+    Args:
+        body: Raw request body
+        secret: Webhook secret
+
+    Returns:
+        Signature header value in 'sha256=<hex digest>' form
+    """
+    digest = hmac.new(secret.encode("utf-8"), body, hashlib.sha256).hexdigest()
+    return f"sha256={digest}"
+
+
+class FakeRedis:
+    """In-memory stand-in for the Redis client's idempotency operations."""
+
+    def __init__(self):
+        """Initialize an empty key store."""
+        self.store: dict[str, str] = {}
+
+    async def exists(self, key: str) -> bool:
+        return key in self.store
+
+    async def set_with_ttl(self, key: str, value: str, ttl: int) -> None:
+        self.store[key] = value
+
+    def clear(self) -> None:
+        self.store.clear()
+
+
+class NotifyingJobStore(dict):
+    """In-memory job store that signals waiters when a job reaches a terminal status."""
 
-        app.state.redis_client = Mock()
-        app.state.redis_client.exists = AsyncMock(return_value=False)
-        app.state.redis_client.set_with_ttl = AsyncMock()
+    def __init__(self, events: dict[str, asyncio.Event]):
+        """Initialize the store.
 
-        app.state.vector_db = Mock()
-        app.state.vector_db.query_similar = AsyncMock(return_value=[])
+        Args:
+            events: Per-job completion events, keyed by job ID
+        """
+        super().__init__()
+        self.events = events
 
-        app.state.llm_client = Mock()
-        app.state.llm_client.generate = AsyncMock(
-            return_value="# Test Cases\\n\\nGenerated test cases...")
+    def __setitem__(self, job_id, job):
+        super().__setitem__(job_id, job)
+        event = self.events.setdefault(job_id, asyncio.Event())
+        if job.status in TERMINAL_STATUSES:
+            event.set()
 
-        app.state.github_client = Mock()
-        app.state.github_client.create_branch = AsyncMock()
-        app.state.github_client.create_or_update_file = AsyncMock()
-        app.state.github_client.create_pull_request = AsyncMock(
-            return_value={"number": 1, "html_url": "https://github.com/owner/repo/pull/1"})
-        app.state.github_client.add_issue_comment = AsyncMock()
 
+class TestEndToEndWorkflow:
+    """Integration tests for complete webhook processing workflow."""
+
+    @pytest.fixture(scope="session")
+    def shared_app(self):
+        """Fixture for FastAPI app and services, built once per test session."""
+        app = create_app()
+
+        # Manually initialize state (lifespan doesn't run with httpx test client)
+        app.state.job_events = {}
+        app.state.jobs = NotifyingJobStore(app.state.job_events)  # In-memory job storage
+
+        app.state.redis_client = FakeRedis()
+        app.state.vector_db = SimpleNamespace()
+        app.state.llm_client = SimpleNamespace()
+        app.state.github_client = Mock()  # Also serves repository lookups (get_repo)
         app.state.embedding_service = Mock()
 
         app.state.webhook_service = WebhookService(
@@ -69,24 +119,64 @@ class TestEndToEndWorkflow:
             config=settings
         )
 
-        yield app
-        # No cleanup needed
+        return app
 
     @pytest.fixture
-    async def test_client(self, app):
-        """Fixture for async HTTP test client."""
-        from httpx import ASGITransport, AsyncClient
+    def app(self, shared_app):
+        """Fixture for the shared app with per-test state and default mock behaviour."""
+        app = shared_app
 
-        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
-            yield client
+        # Jobs and idempotency keys must not leak between tests
+        app.state.jobs.clear()
+        app.state.job_events.clear()
+        app.state.webhook_service._seen_keys.clear()
+        app.state.redis_client.clear()
+
+        # Tests replace client methods freely, so restore defaults every time.
+        # Defaults are plain coroutines; tests that inspect calls install AsyncMocks.
+        app.state.vector_db.query_similar = async_return([])
+
+        app.state.llm_client.generate = async_return("# Test Cases\\n\\nGenerated test cases...")
+
+        app.state.github_client.create_branch = async_return()
+        app.state.github_client.create_or_update_file = async_return()
+        app.state.github_client.create_pull_request = async_return(
+            {"number": 1, "html_url": "https://github.com/owner/repo/pull/1"})
+        app.state.github_client.add_issue_comment = async_return()
+
+        return app
 
     @pytest.fixture
+    def configured_github(self, app):
+        """Fixture for the GitHub client with call-recording mocks returning PR #123."""
+        github = app.state.github_client
+        github.create_branch = AsyncMock()
+        github.create_or_update_file = AsyncMock()
+        github.create_pull_request = AsyncMock(return_value={
+            "number": 123,
+            "html_url": "https://github.com/owner/test-repo/pull/123",
+            "state": "open"
+        })
+        github.add_issue_comment = AsyncMock()
+        return github
+
+    @pytest_asyncio.fixture(scope="session", loop_scope="session")
+    async def test_client(self, shared_app):
+        """Fixture for async HTTP test client, shared across the session."""
+        # The transport is in-process, so a single pooled connection suffices
+        async with AsyncClient(
+            transport=ASGITransport(app=shared_app),
+            base_url="http://test",
+            limits=Limits(max_connections=1, max_keepalive_connections=1)
+        ) as client:
+            yield client
+
+    @pytest.fixture(scope="session")
     def webhook_secret(self):
         """Fixture for webhook secret - must match settings.github_webhook_secret."""
-        from src.core.config import settings
         return settings.github_webhook_secret
 
-    @pytest.fixture
+    @pytest.fixture(scope="session")
     def valid_webhook_payload(self):
         """Fixture for valid GitHub webhook payload with 'generate-tests' label."""
         return {
@@ -100,8 +190,8 @@ class TestEndToEndWorkflow:
                     {"name": "enhancement"},
                     {"name": "priority-high"}
                 ],
-                "created_at": datetime.now().isoformat(),
-                "updated_at": datetime.now().isoformat()
+                "created_at": "2025-01-15T10:30:00",
+                "updated_at": "2025-01-15T10:30:00"
             },
             "repository": {
                 "full_name": "owner/test-repo",
@@ -112,30 +202,56 @@ class TestEndToEndWorkflow:
             }
         }
 
-    def generate_signature(self, payload: dict, secret: str) -> str:
-        """Helper to generate HMAC-SHA256 signature for webhook."""
-        payload_bytes = json.dumps(payload).encode('utf-8')
-        signature = hmac.new(
-            secret.encode('utf-8'),
-            payload_bytes,
-            hashlib.sha256
-        ).hexdigest()
-        return f"sha256={signature}"
-
-    @pytest.mark.asyncio
+    @pytest.fixture(scope="session")
+    def signed_request(self, valid_webhook_payload, webhook_secret):
+        """Fixture for the valid payload's body bytes and signed headers, computed once."""
+        body = json.dumps(valid_webhook_payload).encode('utf-8')
+        return SimpleNamespace(
+            body=body,
+            headers={
+                "X-GitHub-Event": "issues",
+                "X-Hub-Signature-256": sign(body, webhook_secret),
+                "Content-Type": "application/json"
+            }
+        )
+
+    @pytest.fixture(scope="session")
+    def unlabeled_signed_request(self, valid_webhook_payload, webhook_secret):
+        """Fixture for a signed payload without the 'generate-tests' label, computed once."""
+        invalid_payload = {
+            **valid_webhook_payload,
+            "issue": {
+                **valid_webhook_payload["issue"],
+                "labels": [{"name": "enhancement"}]
+            }
+        }
+        body = json.dumps(invalid_payload).encode('utf-8')
+        return SimpleNamespace(
+            body=body,
+            headers={
+                "X-GitHub-Event": "issues",
+                "X-Hub-Signature-256": sign(body, webhook_secret),
+                "Content-Type": "application/json"
+            }
+        )
+
+    async def wait_for_job(self, app, job_id: str, timeout: float = MAX_WAIT_SECONDS) -> None:
+        """Helper to wait until a job reaches a terminal status (no polling)."""
+        await asyncio.wait_for(app.state.job_events[job_id].wait(), timeout=timeout)
+
     @pytest.mark.integration
+    @pytest.mark.xdist_group("workflow_serial")
     async def test_full_webhook_to_pr_workflow(
         self,
         test_client,
-        valid_webhook_payload,
-        webhook_secret,
+        signed_request,
+        configured_github,
         app
     ):
         """Test complete workflow: webhook → validation → AI → PR within 2 minutes (FR-010)."""
         # Get references to already-configured mocks from fixture (no patch needed)
         mock_vector_db = app.state.vector_db
         mock_llm = app.state.llm_client
-        mock_github = app.state.github_client
 
         # Reset and configure mock return values
         mock_vector_db.query_similar = AsyncMock(return_value=[
@@ -152,31 +268,16 @@ class TestEndToEndWorkflow:
 **Then**: User is redirected to Google OAuth consent screen
 """)
 
-        # Reset and configure GitHub operations
-        mock_github.create_branch = AsyncMock()
-        mock_github.create_or_update_file = AsyncMock()
-        mock_github.create_pull_request = AsyncMock(return_value={
-            "number": 123,
-            "html_url": "https://github.com/owner/test-repo/pull/123",
-            "state": "open"
-        })
-        mock_github.add_issue_comment = AsyncMock()
-
-        # Generate valid signature
-        signature = self.generate_signature(
-            valid_webhook_payload, webhook_secret)
         delivery_id = "12345678-1234-1234-1234-123456789012"
 
         # Send webhook request
         start_time = datetime.now()
         response = await test_client.post(
             "/api/webhooks/github",
-            json=valid_webhook_payload,
+            content=signed_request.body,
             headers={
-                "X-GitHub-Event": "issues",
-                "X-Hub-Signature-256": signature,
-                "X-GitHub-Delivery": delivery_id,
-                "Content-Type": "application/json"
+                **signed_request.headers,
+                "X-GitHub-Delivery": delivery_id
             }
         )
 
@@ -188,87 +289,61 @@ class TestEndToEndWorkflow:
 
         # Wait for workflow completion (with timeout)
         job_id = response_data["job_id"]
-        max_wait = 120  # 2 minutes per FR-010
-        poll_interval = 2  # Poll every 2 seconds
-
-        elapsed = 0
-        job_completed = False
-
-        while elapsed < max_wait:
-            await asyncio.sleep(poll_interval)
-            elapsed += poll_interval
+        max_wait = MAX_WAIT_SECONDS
 
-            # Check job status
-            status_response = await test_client.get(f"/api/jobs/{job_id}")
-            status_data = status_response.json()
+        try:
+            await self.wait_for_job(app, job_id, timeout=max_wait)
+        except TimeoutError:
+            pytest.fail(f"Workflow did not complete within {max_wait}s")
 
-            if status_data["status"] == JobStatus.COMPLETED:
-                job_completed = True
-                break
-            elif status_data["status"] == JobStatus.FAILED:
-                pytest.fail(f"Job failed: {status_data.get('error_message')}")
+        status_response = await test_client.get(f"/api/jobs/{job_id}")
+        status_data = status_response.json()
+        if status_data["status"] == JobStatus.FAILED:
+            pytest.fail(f"Job failed: {status_data.get('error_message')}")
 
         # Verify completion within time limit
         end_time = datetime.now()
         duration = (end_time - start_time).total_seconds()
-        assert job_completed, f"Workflow did not complete within {max_wait}s"
+        assert status_data["status"] == JobStatus.COMPLETED
         assert duration < max_wait, f"Workflow took {duration}s (limit: {max_wait}s)"
 
         # Verify all stages executed
         assert mock_vector_db.query_similar.called
         assert mock_llm.generate.called
-        assert mock_github.create_branch.called
-        assert mock_github.create_or_update_file.called
-        assert mock_github.create_pull_request.called
-        assert mock_github.add_issue_comment.called
+        assert configured_github.create_branch.called
+        assert configured_github.create_or_update_file.called
+        assert configured_github.create_pull_request.called
+        assert configured_github.add_issue_comment.called
 
-    @pytest.mark.asyncio
     @pytest.mark.integration
     async def test_idempotency_duplicate_webhook_rejected(
         self,
         test_client,
-        valid_webhook_payload,
-        webhook_secret,
+        signed_request,
         app
     ):
         """Test duplicate webhook is rejected via idempotency key (FR-017)."""
-        # Configure Redis mock to track idempotency keys
-        redis_mock = app.state.redis_client
-        stored_keys = {}
-
-        async def mock_exists(key):
-            return key in stored_keys
-
-        async def mock_set_with_ttl(key, value, ttl):
-            stored_keys[key] = value
-
-        redis_mock.exists = AsyncMock(side_effect=mock_exists)
-        redis_mock.set_with_ttl = AsyncMock(side_effect=mock_set_with_ttl)
-
-        signature = self.generate_signature(
-            valid_webhook_payload, webhook_secret)
+        # The app's FakeRedis tracks idempotency keys across both requests
         delivery_id = "duplicate-test-delivery-id"
 
         headers = {
-            "X-GitHub-Event": "issues",
-            "X-Hub-Signature-256": signature,
-            "X-GitHub-Delivery": delivery_id,
-            "Content-Type": "application/json"
+            **signed_request.headers,
+            "X-GitHub-Delivery": delivery_id
         }
 
         # Send first webhook (should succeed)
         response1 = await test_client.post(
             "/api/webhooks/github",
-            json=valid_webhook_payload,
+            content=signed_request.body,
             headers=headers
         )
         assert response1.status_code == 202
-        job_id1 = response1.json()["job_id"]
+        assert len(app.state.redis_client.store) == 1
 
         # Send duplicate webhook immediately (should be rejected)
         response2 = await test_client.post(
             "/api/webhooks/github",
-            json=valid_webhook_payload,
+            content=signed_request.body,
             headers=headers
         )
 
@@ -278,19 +353,19 @@ class TestEndToEndWorkflow:
         assert error_data["detail"]["error_code"] == "E104"
         assert "duplicate" in error_data["detail"]["message"].lower()
 
-    @pytest.mark.asyncio
     @pytest.mark.integration
     async def test_invalid_signature_rejected(
         self,
         test_client,
-        valid_webhook_payload
+        signed_request
     ):
         """Test webhook with invalid signature is rejected (E101)."""
-        invalid_signature = "sha256=invalid_signature_hash_12345"
+        # Well-formed digest that does not match, so rejection comes from the HMAC comparison
+        invalid_signature = "sha256=" + "0" * 64
 
         response = await test_client.post(
             "/api/webhooks/github",
-            json=valid_webhook_payload,
+            content=signed_request.body,
             headers={
                 "X-GitHub-Event": "issues",
                 "X-Hub-Signature-256": invalid_signature,
@@ -304,34 +379,19 @@ class TestEndToEndWorkflow:
         error_data = response.json()
         assert error_data["detail"]["error_code"] == "E101"
 
-    @pytest.mark.asyncio
     @pytest.mark.integration
     async def test_missing_generate_tests_label_rejected(
         self,
         test_client,
-        valid_webhook_payload,
-        webhook_secret
+        unlabeled_signed_request
     ):
         """Test webhook without 'generate-tests' label is rejected (FR-002)."""
-        # Remove generate-tests label
-        invalid_payload = {
-            **valid_webhook_payload,
-            "issue": {
-                **valid_webhook_payload["issue"],
-                "labels": [{"name": "enhancement"}]
-            }
-        }
-
-        signature = self.generate_signature(invalid_payload, webhook_secret)
-
         response = await test_client.post(
             "/api/webhooks/github",
-            json=invalid_payload,
+            content=unlabeled_signed_request.body,
             headers={
-                "X-GitHub-Event": "issues",
-                "X-Hub-Signature-256": signature,
-                "X-GitHub-Delivery": "missing-label-test",
-                "Content-Type": "application/json"
+                **unlabeled_signed_request.headers,
+                "X-GitHub-Delivery": "missing-label-test"
             }
         )
 
@@ -341,20 +401,19 @@ class TestEndToEndWorkflow:
         assert error_data["detail"]["error_code"] == "E103"
         assert "generate-tests" in error_data["detail"]["message"].lower()
 
-    @pytest.mark.asyncio
     @pytest.mark.integration
+    @pytest.mark.xdist_group("workflow_serial")
     async def test_pr_includes_context_sources(
         self,
         test_client,
-        valid_webhook_payload,
-        webhook_secret,
+        signed_request,
+        configured_github,
         app
     ):
         """Test generated PR includes context from similar issues."""
         # Configure mocks directly (don't use patch.object after services are created)
         mock_vector_db = app.state.vector_db
         mock_llm = app.state.llm_client
-        mock_github = app.state.github_client
 
         # Mock vector DB with specific context
         context_sources = [
@@ -365,56 +424,47 @@ class TestEndToEndWorkflow:
         mock_vector_db.query_similar = AsyncMock(return_value=context_sources)
 
         mock_llm.generate = AsyncMock(return_value="# Test Cases")
-        mock_github.create_branch = AsyncMock()
-        mock_github.create_or_update_file = AsyncMock()
-        mock_github.create_pull_request = AsyncMock(return_value={
-            "number": 123,
-            "html_url": "https://github.com/owner/test-repo/pull/123"
-        })
-        mock_github.add_issue_comment = AsyncMock()
-
-        signature = self.generate_signature(
-            valid_webhook_payload, webhook_secret)
 
         response = await test_client.post(
             "/api/webhooks/github",
-            json=valid_webhook_payload,
+            content=signed_request.body,
             headers={
-                "X-GitHub-Event": "issues",
-                "X-Hub-Signature-256": signature,
-                "X-GitHub-Delivery": "pr-context-test-delivery",
-                "Content-Type": "application/json"
+                **signed_request.headers,
+                "X-GitHub-Delivery": "pr-context-test-delivery"
             }
         )
 
         assert response.status_code == 202
 
         # Wait for completion
-        await asyncio.sleep(5)
+        job_id = response.json()["job_id"]
+        await self.wait_for_job(app, job_id)
 
         # Verify PR was created
-        assert mock_github.create_pull_request.called
+        assert configured_github.create_pull_request.called
         # In a real test we'd check the PR body includes context, but since
         # we're using mocks, just verify the workflow completed
-        job_id = response.json()["job_id"]
         status_response = await test_client.get(f"/api/jobs/{job_id}")
         assert status_response.json()["status"] == "COMPLETED"
 
-    @pytest.mark.asyncio
     @pytest.mark.integration
+    @pytest.mark.xdist_group("workflow_serial")
     @pytest.mark.skip(reason="Retry logic not yet implemented - FR-011 pending")
     async def test_retry_on_ai_timeout(
         self,
         test_client,
-        valid_webhook_payload,
-        webhook_secret,
-        app
+        signed_request,
+        configured_github,
+        app,
+        monkeypatch
     ):
         """Test workflow retries on AI timeout (max 3 attempts per FR-011)."""
+        # Retry backoff should not cost real wall-clock time
+        monkeypatch.setattr("src.services.ai_service.asyncio.sleep", AsyncMock())
+
         # Configure mocks directly (don't use patch.object after services are created)
         mock_vector_db = app.state.vector_db
         mock_llm = app.state.llm_client
-        mock_github = app.state.github_client
 
         mock_vector_db.query_similar = AsyncMock(return_value=[])
 
@@ -430,90 +480,58 @@ class TestEndToEndWorkflow:
             return "# Test Cases"
 
         mock_llm.generate = mock_generate_with_retries
-        mock_github.create_branch = AsyncMock()
-        mock_github.create_or_update_file = AsyncMock()
-        mock_github.create_pull_request = AsyncMock(return_value={
-            "number": 123,
-            "html_url": "https://github.com/owner/test-repo/pull/123"
-        })
-        mock_github.add_issue_comment = AsyncMock()
-
-        signature = self.generate_signature(
-            valid_webhook_payload, webhook_secret)
 
         response = await test_client.post(
             "/api/webhooks/github",
-            json=valid_webhook_payload,
+            content=signed_request.body,
             headers={
-                "X-GitHub-Event": "issues",
-                "X-Hub-Signature-256": signature,
-                "X-GitHub-Delivery": "retry-timeout-test-delivery",
-                "Content-Type": "application/json"
+                **signed_request.headers,
+                "X-GitHub-Delivery": "retry-timeout-test-delivery"
             }
         )
 
         assert response.status_code == 202
 
-        # Wait for retries to complete
-        await asyncio.sleep(30)  # Allow time for 3 retries with backoff
+        # Wait for retries to complete (backoff sleeps are stubbed out)
+        job_id = response.json()["job_id"]
+        await self.wait_for_job(app, job_id)
 
         # Verify job eventually succeeded
-        job_id = response.json()["job_id"]
         status_response = await test_client.get(f"/api/jobs/{job_id}")
         status_data = status_response.json()
 
         assert status_data["status"] == JobStatus.COMPLETED
         assert call_count == 3  # Retried twice, succeeded third time
 
-    @pytest.mark.asyncio
     @pytest.mark.integration
+    @pytest.mark.xdist_group("workflow_serial")
     async def test_correlation_id_tracked_across_workflow(
         self,
         test_client,
-        valid_webhook_payload,
-        webhook_secret,
+        signed_request,
         app
     ):
         """Test correlation ID is tracked throughout entire workflow."""
-        with patch.object(app.state, 'vector_db') as mock_vector_db, \
-                patch.object(app.state, 'llm_client') as mock_llm, \
-                patch.object(app.state, 'github_client') as mock_github:
-
-            mock_vector_db.query_similar = AsyncMock(return_value=[])
-            mock_llm.generate = AsyncMock(return_value="# Test Cases")
-            mock_github.create_branch = AsyncMock()
-            mock_github.create_or_update_file = AsyncMock()
-            mock_github.create_pull_request = AsyncMock(return_value={
-                "number": 123,
-                "html_url": "https://github.com/owner/test-repo/pull/123"
-            })
-            mock_github.add_issue_comment = AsyncMock()
-
-            signature = self.generate_signature(
-                valid_webhook_payload, webhook_secret)
-
-            response = await test_client.post(
-                "/api/webhooks/github",
-                json=valid_webhook_payload,
-                headers={
-                    "X-GitHub-Event": "issues",
-                    "X-Hub-Signature-256": signature,
-                    "X-GitHub-Delivery": "correlation-tracking-test-delivery",
-                    "Content-Type": "application/json"
-                }
-            )
-
-            assert response.status_code == 202
-            correlation_id = response.json()["correlation_id"]
-
-            # Verify correlation_id is a valid UUID
-            import uuid
-            assert uuid.UUID(correlation_id)
-
-            # Wait and check job status includes same correlation_id
-            await asyncio.sleep(2)
-            job_id = response.json()["job_id"]
-            status_response = await test_client.get(f"/api/jobs/{job_id}")
-            status_data = status_response.json()
-
-            assert status_data["correlation_id"] == correlation_id
+        # The app fixture's default client stubs cover every workflow call
+        response = await test_client.post(
+            "/api/webhooks/github",
+            content=signed_request.body,
+            headers={
+                **signed_request.headers,
+                "X-GitHub-Delivery": "correlation-tracking-test-delivery"
+            }
+        )
+
+        assert response.status_code == 202
+        correlation_id = response.json()["correlation_id"]
+
+        # Verify correlation_id is a valid UUID
+        assert uuid.UUID(correlation_id)
+
+        # Wait and check job status includes same correlation_id
+        job_id = response.json()["job_id"]
+        await self.wait_for_job(app, job_id)
+        status_response = await test_client.get(f"/api/jobs/{job_id}")
+        status_data = status_response.json()
+
+        assert status_data["correlation_id"] == correlation_id
@@ -1,10 +1,53 @@
 """Unit tests for WebhookEvent model."""
-from datetime import datetime
+import json
+from types import MappingProxyType
 
 import pytest
 from pydantic import ValidationError
 
 from src.models.webhook_event import WebhookEvent
+from tests.helpers import FROZEN_NOW
+
+# Issue titles at and just above the 256-character limit
+TITLE_256 = "x" * 256
+TITLE_257 = TITLE_256 + "x"
+
+# Issue body longer than the 5000-character truncation limit
+LONG_BODY = "x" * 6000
+
+# Valid constructor arguments shared by every event in these tests (read-only)
+BASE_EVENT_KWARGS = MappingProxyType({
+    "event_id": "550e8400-e29b-41d4-a716-446655440000",
+    "event_type": "issues.opened",
+    "issue_number": 123,
+    "issue_title": "Test",
+    "issue_body": "Body",
+    "labels": ["generate-tests"],
+    "repository": "owner/repo",
+    "signature": "sha256=test",
+    "received_at": FROZEN_NOW,
+    "correlation_id": "660e8400-e29b-41d4-a716-446655440001"
+})
+
+# Baseline event as raw JSON bytes, as received from a webhook delivery
+EVENT_JSON = json.dumps({**BASE_EVENT_KWARGS, "received_at": FROZEN_NOW.isoformat()}).encode()
+
+# (field, value, expected error loc or None when the value is accepted)
+FIELD_CASES = [
+    # event_type must be issues.opened or issues.labeled
+    ("event_type", "issues.opened", None),
+    ("event_type", "issues.labeled", None),
+    ("event_type", "pull_request.opened", "event_type"),
+    # signature must have the 'sha256=' prefix
+    ("signature", "sha256=abcdef1234567890", None),
+    ("signature", "abcdef1234567890", "signature"),
+    # repository must be in 'owner/repo' format
+    ("repository", "owner/repo", None),
+    ("repository", "invalid-format", "repository"),
+    # labels must contain 'generate-tests' (FR-002)
+    ("labels", ["generate-tests", "bug"], None),
+    ("labels", ["bug", "enhancement"], "labels"),
+]
 
 
 class TestWebhookEventValidation:
@@ -12,190 +55,65 @@ class TestWebhookEventValidation:
 
     def test_create_valid_webhook_event(self):
         """Test creating a valid webhook event."""
-        event = WebhookEvent(
-            event_id="550e8400-e29b-41d4-a716-446655440000",
-            event_type="issues.opened",
-            issue_number=123,
-            issue_title="Add authentication feature",
-            issue_body="Implement OAuth2 authentication with Google provider.",
-            labels=["generate-tests", "enhancement"],
-            repository="owner/repo",
-            signature="sha256=abc123def456",
-            received_at=datetime.now(),
-            correlation_id="660e8400-e29b-41d4-a716-446655440001"
-        )
+        event = WebhookEvent(**{
+            **BASE_EVENT_KWARGS,
+            "issue_title": "Add authentication feature",
+            "issue_body": "Implement OAuth2 authentication with Google provider.",
+            "labels": ["generate-tests", "enhancement"],
+            "signature": "sha256=abc123def456"
+        })
 
         assert event.event_id == "550e8400-e29b-41d4-a716-446655440000"
         assert event.event_type == "issues.opened"
         assert event.issue_number == 123
         assert "generate-tests" in event.labels
 
-    def test_event_type_validation(self):
-        """Test event_type must be issues.opened or issues.labeled."""
-        valid_data = {
-            "event_id": "550e8400-e29b-41d4-a716-446655440000",
-            "event_type": "issues.opened",
-            "issue_number": 123,
-            "issue_title": "Test issue",
-            "issue_body": "Test body",
-            "labels": ["generate-tests"],
-            "repository": "owner/repo",
-            "signature": "sha256=test",
-            "received_at": datetime.now(),
-            "correlation_id": "660e8400-e29b-41d4-a716-446655440001"
-        }
-
-        # Valid: issues.opened
-        event = WebhookEvent(**valid_data)
-        assert event.event_type == "issues.opened"
+    @pytest.mark.parametrize(("field", "value", "error_loc"), FIELD_CASES)
+    def test_field_validation(self, field, value, error_loc):
+        """Test event_type, signature, repository and labels accept or reject each value."""
+        kwargs = {**BASE_EVENT_KWARGS, field: value}
 
-        # Valid: issues.labeled
-        valid_data["event_type"] = "issues.labeled"
-        event = WebhookEvent(**valid_data)
-        assert event.event_type == "issues.labeled"
+        if error_loc is None:
+            event = WebhookEvent(**kwargs)
+            assert getattr(event, field) == value
+            return
 
-        # Invalid: other event type
         with pytest.raises(ValidationError) as exc_info:
-            valid_data["event_type"] = "pull_request.opened"
-            WebhookEvent(**valid_data)
-        assert "event_type" in str(exc_info.value)
+            WebhookEvent(**kwargs)
+        assert any(e["loc"] == (error_loc,) for e in exc_info.value.errors())
 
     def test_issue_title_max_length(self):
         """Test issue_title is limited to 256 characters."""
-        valid_data = {
-            "event_id": "550e8400-e29b-41d4-a716-446655440000",
-            "event_type": "issues.opened",
-            "issue_number": 123,
-            "issue_title": "x" * 256,  # Exactly 256 chars
-            "issue_body": "Test body",
-            "labels": ["generate-tests"],
-            "repository": "owner/repo",
-            "signature": "sha256=test",
-            "received_at": datetime.now(),
-            "correlation_id": "660e8400-e29b-41d4-a716-446655440001"
-        }
-
         # Should succeed at 256 chars
-        event = WebhookEvent(**valid_data)
+        event = WebhookEvent(**{**BASE_EVENT_KWARGS, "issue_title": TITLE_256})
         assert len(event.issue_title) == 256
 
         # Should fail above 256 chars
         with pytest.raises(ValidationError) as exc_info:
-            valid_data["issue_title"] = "x" * 257
-            WebhookEvent(**valid_data)
-        assert "issue_title" in str(exc_info.value)
+            WebhookEvent(**{**BASE_EVENT_KWARGS, "issue_title": TITLE_257})
+        assert any(e["loc"] == ("issue_title",) for e in exc_info.value.errors())
 
     def test_issue_body_truncation(self):
         """Test issue_body is truncated to 5000 characters with warning."""
-        long_body = "x" * 6000
-
-        event = WebhookEvent(
-            event_id="550e8400-e29b-41d4-a716-446655440000",
-            event_type="issues.opened",
-            issue_number=123,
-            issue_title="Test",
-            issue_body=long_body,
-            labels=["generate-tests"],
-            repository="owner/repo",
-            signature="sha256=test",
-            received_at=datetime.now(),
-            correlation_id="660e8400-e29b-41d4-a716-446655440001"
-        )
+        event = WebhookEvent(**{**BASE_EVENT_KWARGS, "issue_body": LONG_BODY})
 
         # Should be truncated to 5000 chars
         assert len(event.issue_body) == 5000
-        assert event.issue_body == long_body[:5000]
-
-    def test_labels_must_contain_generate_tests(self):
-        """Test labels validation requires 'generate-tests' tag."""
-        valid_data = {
-            "event_id": "550e8400-e29b-41d4-a716-446655440000",
-            "event_type": "issues.opened",
-            "issue_number": 123,
-            "issue_title": "Test",
-            "issue_body": "Body",
-            "labels": ["generate-tests", "bug"],
-            "repository": "owner/repo",
-            "signature": "sha256=test",
-            "received_at": datetime.now(),
-            "correlation_id": "660e8400-e29b-41d4-a716-446655440001"
-        }
-
-        # Should succeed with generate-tests label
-        event = WebhookEvent(**valid_data)
-        assert "generate-tests" in event.labels
-
-        # Should fail without generate-tests label
-        with pytest.raises(ValidationError) as exc_info:
-            valid_data["labels"] = ["bug", "enhancement"]
-            WebhookEvent(**valid_data)
-        assert "generate-tests" in str(exc_info.value).lower()
-
-    def test_signature_format(self):
-        """Test signature must be valid HMAC-SHA256 format."""
-        valid_data = {
-            "event_id": "550e8400-e29b-41d4-a716-446655440000",
-            "event_type": "issues.opened",
-            "issue_number": 123,
-            "issue_title": "Test",
-            "issue_body": "Body",
-            "labels": ["generate-tests"],
-            "repository": "owner/repo",
-            "signature": "sha256=abcdef1234567890",
-            "received_at": datetime.now(),
-            "correlation_id": "660e8400-e29b-41d4-a716-446655440001"
-        }
-
-        # Valid sha256= prefix
-        event = WebhookEvent(**valid_data)
-        assert event.signature.startswith("sha256=")
-
-        # Invalid format (missing sha256= prefix)
-        with pytest.raises(ValidationError) as exc_info:
-            valid_data["signature"] = "abcdef1234567890"
-            WebhookEvent(**valid_data)
-        assert "signature" in str(exc_info.value).lower()
-
-    def test_repository_format(self):
-        """Test repository must be in 'owner/repo' format."""
-        valid_data = {
-            "event_id": "550e8400-e29b-41d4-a716-446655440000",
-            "event_type": "issues.opened",
-            "issue_number": 123,
-            "issue_title": "Test",
-            "issue_body": "Body",
-            "labels": ["generate-tests"],
-            "repository": "owner/repo",
-            "signature": "sha256=test",
-            "received_at": datetime.now(),
-            "correlation_id": "660e8400-e29b-41d4-a716-446655440001"
-        }
-
-        # Valid format
-        event = WebhookEvent(**valid_data)
-        assert "/" in event.repository
-
-        # Invalid format (no slash)
-        with pytest.raises(ValidationError) as exc_info:
-            valid_data["repository"] = "invalid-format"
-            WebhookEvent(**valid_data)
-        assert "repository" in str(exc_info.value).lower()
+        assert event.issue_body == LONG_BODY[:5000]
 
     def test_webhook_event_immutability(self):
         """Test WebhookEvent is immutable once created."""
-        event = WebhookEvent(
-            event_id="550e8400-e29b-41d4-a716-446655440000",
-            event_type="issues.opened",
-            issue_number=123,
-            issue_title="Test",
-            issue_body="Body",
-            labels=["generate-tests"],
-            repository="owner/repo",
-            signature="sha256=test",
-            received_at=datetime.now(),
-            correlation_id="660e8400-e29b-41d4-a716-446655440001"
-        )
+        assert WebhookEvent.model_config["frozen"] is True
+
+        event = WebhookEvent(**BASE_EVENT_KWARGS)
 
         # Should not allow modification
         with pytest.raises(ValidationError):
             event.issue_number = 456
+
+    def test_validate_json(self):
+        """Test an event validates straight from JSON bytes."""
+        event = WebhookEvent.model_validate_json(EVENT_JSON)
+
+        assert event == WebhookEvent(**BASE_EVENT_KWARGS)
+        assert event.received_at == FROZEN_NOW
@@ -0,0 +1,20 @@
+"""Shared fixtures for service unit tests."""
+import asyncio
+
+import pytest
+
+
+@pytest.fixture
+def recorded_sleeps(monkeypatch):
+    """Fixture replacing service backoff sleeps with a recorder that returns at once.
+
+    The services call asyncio.sleep through the shared asyncio module, so the
+    patch covers AIService and GitHubService alike for the duration of the test.
+    """
+    delays = []
+
+    async def fake_sleep(delay, *args, **kwargs):
+        delays.append(delay)
+
+    monkeypatch.setattr(asyncio, "sleep", fake_sleep)
+    return delays
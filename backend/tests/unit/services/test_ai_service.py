@@ -1,12 +1,50 @@
 """Unit tests for AIService with LangGraph workflow."""
-from datetime import datetime
+import asyncio
 from unittest.mock import ANY, AsyncMock, Mock
 
 import pytest
 
+from src.core.cache import RedisClient
 from src.core.exceptions import AIGenerationError, AITimeoutError, VectorDBQueryError
+from src.core.llm_client import LLMClient
 from src.models.processing_job import JobStatus, ProcessingJob
 from src.services.ai_service import AIService, WorkflowStage
+from tests.helpers import FROZEN_NOW, async_raise, async_return
+
+# Wall-time ceiling (seconds) for mocked workflow runs; an awaited sleep or hung
+# coroutine in the service trips this instead of stalling the suite (asyncio.timeout
+# only fires at an await, so synchronous blocking calls are not caught)
+TEST_WALL_TIME_BUDGET = 5
+
+# Validated once; ProcessingJob is frozen, so every test can share this instance
+SAMPLE_JOB = ProcessingJob(
+    job_id="770e8400-e29b-41d4-a716-446655440000",
+    webhook_event_id="550e8400-e29b-41d4-a716-446655440000",
+    status=JobStatus.PENDING,
+    started_at=FROZEN_NOW,
+    idempotency_key="abc123def456abc123def456abc123def456abc123def456abc123def456abcd",
+    current_stage=WorkflowStage.RECEIVE,
+    correlation_id="660e8400-e29b-41d4-a716-446655440001"
+)
+
+# (issue, context, tokens the rendered prompt must contain)
+PROMPT_CASES = [
+    pytest.param(
+        {"number": 42, "title": "Add authentication", "body": "Implement OAuth2 with Google provider"},
+        [
+            {"issue_number": 38, "content": "Test case for login"},
+            {"issue_number": 39, "content": "Test case for logout"}
+        ],
+        ("Issue #42", "Add authentication", "OAuth2", "#38", "login", "#39", "logout"),
+        id="with_context"
+    ),
+    pytest.param(
+        {"number": 99, "title": "Fix pagination", "body": "Cursor-based paging"},
+        [],
+        ("Issue #99", "Fix pagination", "Cursor-based paging"),
+        id="no_context"
+    ),
+]
 
 
 class TestAIServiceWorkflow:
@@ -16,11 +54,11 @@ class TestAIServiceWorkflow:
     def mock_dependencies(self):
         """Fixture for AIService dependencies."""
         return {
-            'llm_client': AsyncMock(),
+            'llm_client': AsyncMock(spec=LLMClient),
             'vector_db': AsyncMock(),
             'embedding_service': Mock(),
             'github_client': AsyncMock(),
-            'redis_client': AsyncMock(),
+            'redis_client': AsyncMock(spec=RedisClient),
             'config': Mock()
         }
 
@@ -37,26 +75,26 @@ class TestAIServiceWorkflow:
     @pytest.fixture
     def sample_processing_job(self):
         """Fixture for sample ProcessingJob."""
-        return ProcessingJob(
-            job_id="770e8400-e29b-41d4-a716-446655440000",
-            webhook_event_id="550e8400-e29b-41d4-a716-446655440000",
-            status=JobStatus.PENDING,
-            started_at=datetime.now(),
-            idempotency_key="abc123def456abc123def456abc123def456abc123def456abc123def456abcd",
-            current_stage=WorkflowStage.RECEIVE,
-            correlation_id="660e8400-e29b-41d4-a716-446655440001"
-        )
+        return SAMPLE_JOB
 
-    @pytest.mark.asyncio
-    async def test_stage_1_receive_webhook(self, ai_service, sample_processing_job):
-        """Test RECEIVE stage: Validate webhook and initialize job."""
-        # Mock webhook event
+    @pytest.fixture
+    def mock_webhook_event(self):
+        """Fixture for the webhook event every workflow stage reads from."""
         mock_webhook_event = Mock()
         mock_webhook_event.issue_number = 42
         mock_webhook_event.issue_title = "Add authentication"
         mock_webhook_event.issue_body = "Implement OAuth2"
         mock_webhook_event.repository = "owner/repo"
-
+        return mock_webhook_event
+
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_stage_1_receive_webhook(
+        self,
+        ai_service,
+        sample_processing_job,
+        mock_webhook_event
+    ):
+        """Test RECEIVE stage: Validate webhook and initialize job."""
         # Execute RECEIVE stage
         result = await ai_service.receive_webhook(
             job=sample_processing_job,
@@ -66,13 +104,14 @@ class TestAIServiceWorkflow:
         assert result.current_stage == WorkflowStage.RETRIEVE
         assert result.status == JobStatus.PROCESSING
 
-    @pytest.mark.asyncio
-    async def test_stage_2_retrieve_context(self, ai_service, sample_processing_job):
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_stage_2_retrieve_context(
+        self,
+        ai_service,
+        sample_processing_job,
+        mock_webhook_event
+    ):
         """Test RETRIEVE stage: Query vector DB for top 5 similar test cases (FR-004)."""
-        # Mock webhook event
-        mock_webhook_event = Mock()
-        mock_webhook_event.issue_body = "Implement OAuth2 authentication"
-
         # Mock vector DB to return 5 similar documents
         mock_similar_docs = [
             {"issue_number": 38, "similarity": 0.85},
@@ -97,14 +136,18 @@ class TestAIServiceWorkflow:
         # Verify vector DB query was called
         ai_service.vector_db.query_similar.assert_called_once()
 
-    @pytest.mark.asyncio
-    async def test_stage_2_retrieve_no_context(self, ai_service, sample_processing_job):
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_stage_2_retrieve_no_context(
+        self,
+        ai_service,
+        sample_processing_job,
+        mock_webhook_event
+    ):
         """Test RETRIEVE stage handles case with no similar context."""
-        mock_webhook_event = Mock()
         mock_webhook_event.issue_body = "Completely new feature"
 
         # Mock vector DB to return empty results
-        ai_service.vector_db.query_similar = AsyncMock(return_value=[])
+        ai_service.vector_db.query_similar = async_return([])
 
         # Should still proceed with empty context
         context = await ai_service.retrieve_context(
@@ -114,14 +157,14 @@ class TestAIServiceWorkflow:
 
         assert len(context) == 0
 
-    @pytest.mark.asyncio
-    async def test_stage_3_generate_test_cases(self, ai_service, sample_processing_job):
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_stage_3_generate_test_cases(
+        self,
+        ai_service,
+        sample_processing_job,
+        mock_webhook_event
+    ):
         """Test GENERATE stage: AI generates test cases using LLM."""
-        mock_webhook_event = Mock()
-        mock_webhook_event.issue_number = 42
-        mock_webhook_event.issue_title = "Add authentication"
-        mock_webhook_event.issue_body = "Implement OAuth2"
-
         mock_context = [
             {"issue_number": 38, "content": "Similar test case"}
         ]
@@ -144,33 +187,34 @@ class TestAIServiceWorkflow:
         # Verify LLM was called with prompt
         ai_service.llm_client.generate.assert_called_once()
 
-    @pytest.mark.asyncio
-    async def test_stage_3_generate_timeout(self, ai_service, sample_processing_job):
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_stage_3_generate_timeout(
+        self,
+        ai_service,
+        sample_processing_job,
+        mock_webhook_event
+    ):
         """Test GENERATE stage handles AI timeout (120s per FR-009)."""
-        import asyncio
-
-        mock_webhook_event = Mock()
-        mock_webhook_event.issue_number = 42
-        mock_webhook_event.issue_title = "Add authentication"
-        mock_webhook_event.issue_body = "Implement OAuth2"
-
-        # Mock LLM to timeout
+        # Mock LLM to never respond; shrink the 120s budget so the test stays fast
         async def mock_timeout(*args, **kwargs):
-            await asyncio.sleep(121)  # Exceed 120s timeout
+            await asyncio.Event().wait()
 
         ai_service.llm_client.generate = mock_timeout
+        ai_service.timeout = 0.01
 
-        # Should raise AITimeoutError (E302)
+        # Should raise AITimeoutError (E302); the outer guard turns a service that
+        # stops honouring its budget into a failure instead of a hung run
         with pytest.raises(AITimeoutError) as exc_info:
-            await ai_service.generate_test_cases(
-                job=sample_processing_job,
-                webhook_event=mock_webhook_event,
-                context=[]
-            )
+            async with asyncio.timeout(TEST_WALL_TIME_BUDGET):
+                await ai_service.generate_test_cases(
+                    job=sample_processing_job,
+                    webhook_event=mock_webhook_event,
+                    context=[]
+                )
 
         assert exc_info.value.error_code == "E302"
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_stage_4_commit_to_branch(self, ai_service, sample_processing_job):
         """Test COMMIT stage: Create branch and commit test document."""
         mock_test_document = Mock()
@@ -197,7 +241,7 @@ class TestAIServiceWorkflow:
         ai_service.github_client.create_or_update_file.assert_called_once()
         assert result.current_stage == WorkflowStage.CREATE_PR
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_stage_5_create_pull_request(self, ai_service, sample_processing_job):
         """Test CREATE_PR stage: Open GitHub pull request."""
         mock_test_document = Mock()
@@ -225,7 +269,7 @@ class TestAIServiceWorkflow:
         assert updated_document.pr_number == 123
         assert updated_document.pr_url == "https://github.com/owner/repo/pull/123"
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_stage_6_finalize_job(self, ai_service, sample_processing_job):
         """Test FINALIZE stage: Add comment to issue and complete job."""
         mock_test_document = Mock()
@@ -252,42 +296,67 @@ class TestAIServiceWorkflow:
         assert completed_job.current_stage == WorkflowStage.FINALIZE
         assert completed_job.completed_at is not None
 
-    @pytest.mark.asyncio
-    async def test_full_workflow_end_to_end(self, ai_service, sample_processing_job):
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_full_workflow_end_to_end(
+        self,
+        ai_service,
+        sample_processing_job,
+        mock_webhook_event
+    ):
         """Test complete 6-stage workflow: RECEIVE → RETRIEVE → GENERATE → COMMIT → CREATE_PR → FINALIZE."""
-        mock_webhook_event = Mock()
-        mock_webhook_event.issue_number = 42
-        mock_webhook_event.issue_title = "Add authentication"
-        mock_webhook_event.issue_body = "Implement OAuth2"
-        mock_webhook_event.repository = "owner/repo"
-
-        # Mock all dependencies
-        ai_service.vector_db.query_similar = AsyncMock(return_value=[])
-        ai_service.llm_client.generate = AsyncMock(return_value="# Test Cases")
-        ai_service.github_client.create_branch = AsyncMock()
-        ai_service.github_client.create_or_update_file = AsyncMock()
-        ai_service.github_client.create_pull_request = AsyncMock(
-            return_value={"number": 123, "html_url": "https://github.com/owner/repo/pull/123"}
-        )
-        ai_service.github_client.add_issue_comment = AsyncMock()
-
-        # Execute full workflow
-        final_job = await ai_service.execute_workflow(
-            job=sample_processing_job,
-            webhook_event=mock_webhook_event
+        # Mock all dependencies, attached to one parent so call order is recorded
+        # (the workflow graph calls the PyGithub-backed client synchronously)
+        calls = Mock()
+        calls.attach_mock(AsyncMock(return_value=[]), "query_similar")
+        calls.attach_mock(AsyncMock(return_value="# Test Cases"), "generate")
+        calls.attach_mock(Mock(), "get_repo")
+        calls.attach_mock(Mock(), "create_branch")
+        calls.attach_mock(Mock(), "create_or_update_file")
+        calls.attach_mock(
+            Mock(return_value={"number": 123, "html_url": "https://github.com/owner/repo/pull/123"}),
+            "create_pull_request"
         )
+        calls.attach_mock(Mock(), "add_issue_comment")
+
+        ai_service.vector_db.query_similar = calls.query_similar
+        ai_service.llm_client.generate = calls.generate
+        ai_service.github_client.get_repo = calls.get_repo
+        ai_service.github_client.create_branch = calls.create_branch
+        ai_service.github_client.create_or_update_file = calls.create_or_update_file
+        ai_service.github_client.create_pull_request = calls.create_pull_request
+        ai_service.github_client.add_issue_comment = calls.add_issue_comment
+
+        # Execute full workflow; all I/O is mocked, so it must finish well within budget
+        async with asyncio.timeout(TEST_WALL_TIME_BUDGET):
+            final_job = await ai_service.execute_workflow(
+                job=sample_processing_job,
+                webhook_event=mock_webhook_event
+            )
 
         # Verify all stages completed
         assert final_job.status == JobStatus.COMPLETED
         assert final_job.current_stage == WorkflowStage.FINALIZE
 
-    @pytest.mark.asyncio
-    async def test_retry_logic_exponential_backoff(self, ai_service, sample_processing_job):
-        """Test retry logic with exponential backoff (5s, 15s, 45s per FR-011)."""
-        mock_webhook_event = Mock()
-        mock_webhook_event.issue_number = 42
-        mock_webhook_event.issue_body = "Test"
+        # Verify stages called their collaborators in workflow order
+        assert [name for name, _, _ in calls.method_calls] == [
+            "query_similar",
+            "generate",
+            "get_repo",
+            "create_branch",
+            "create_or_update_file",
+            "create_pull_request",
+            "add_issue_comment"
+        ]
 
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_retry_logic_exponential_backoff(
+        self,
+        ai_service,
+        sample_processing_job,
+        mock_webhook_event,
+        recorded_sleeps
+    ):
+        """Test retry logic with exponential backoff (5s, 15s, 45s per FR-011)."""
         # Mock LLM to fail first 2 attempts, succeed on 3rd
         call_count = 0
         async def mock_generate_with_retries(*args, **kwargs):
@@ -309,14 +378,17 @@ class TestAIServiceWorkflow:
         # Verify retry count and delays
         assert sample_processing_job.retry_count <= 3
         assert call_count == 3  # Failed twice, succeeded third time
-
-    @pytest.mark.asyncio
-    async def test_retry_exhausted_fails_job(self, ai_service, sample_processing_job):
+        assert recorded_sleeps == [5, 15]  # Backoff before the 2nd and 3rd attempts
+
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_retry_exhausted_fails_job(
+        self,
+        ai_service,
+        sample_processing_job,
+        mock_webhook_event,
+        recorded_sleeps
+    ):
         """Test job fails after 3 retry attempts."""
-        mock_webhook_event = Mock()
-        mock_webhook_event.issue_number = 42
-        mock_webhook_event.issue_body = "Test"
-
         # Mock LLM to always fail
         ai_service.llm_client.generate = AsyncMock(
             side_effect=AIGenerationError("Persistent failure", "E301")
@@ -333,45 +405,28 @@ class TestAIServiceWorkflow:
 
         # Verify generate was called 3 times (3 retry attempts)
         assert ai_service.llm_client.generate.call_count == 3
+        assert recorded_sleeps == [5, 15]  # No backoff after the final attempt
 
-    @pytest.mark.asyncio
-    async def test_prompt_template_rendering(self, ai_service):
+    @pytest.mark.parametrize(("issue", "context", "expected_tokens"), PROMPT_CASES)
+    def test_prompt_template_rendering(self, ai_service, issue, context, expected_tokens):
         """Test prompt template is rendered correctly with issue and context."""
-        issue_data = {
-            "number": 42,
-            "title": "Add authentication",
-            "body": "Implement OAuth2 with Google provider"
-        }
-
-        context_data = [
-            {"issue_number": 38, "content": "Test case for login"},
-            {"issue_number": 39, "content": "Test case for logout"}
-        ]
-
-        # Render prompt
-        prompt = ai_service.render_prompt(
-            issue=issue_data,
-            context=context_data
-        )
-
-        # Verify prompt contains issue details
-        assert "42" in prompt
-        assert "Add authentication" in prompt
-        assert "OAuth2" in prompt
-
-        # Verify context is included
-        assert "38" in prompt or "login" in prompt
-        assert "39" in prompt or "logout" in prompt
-
-    @pytest.mark.asyncio
-    async def test_vector_db_failure_handling(self, ai_service, sample_processing_job):
+        prompt = ai_service.render_prompt(issue=issue, context=context)
+
+        # Verify prompt contains issue details and any context
+        missing = [token for token in expected_tokens if token not in prompt]
+        assert missing == []
+
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_vector_db_failure_handling(
+        self,
+        ai_service,
+        sample_processing_job,
+        mock_webhook_event
+    ):
         """Test workflow handles vector DB failures gracefully."""
-        mock_webhook_event = Mock()
-        mock_webhook_event.issue_body = "Test"
-
         # Mock vector DB to fail
-        ai_service.vector_db.query_similar = AsyncMock(
-            side_effect=VectorDBQueryError("Connection failed", "E201")
+        ai_service.vector_db.query_similar = async_raise(
+            VectorDBQueryError("Connection failed", "E201")
         )
 
         # Should raise VectorDBQueryError
@@ -1,11 +1,52 @@
 """Unit tests for GitHubService operations."""
-from datetime import datetime
+import asyncio
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, Mock
 
 import pytest
 
 from src.core.exceptions import GitHubAPIError, GitHubBranchExistsError, GitHubRateLimitError
 from src.services.github_service import GitHubService
+from tests.helpers import FROZEN_NOW
+
+# Thin wrappers that forward their arguments unchanged to the GitHub client:
+# (service method, client method, call kwargs)
+PASSTHROUGH_CASES = [
+    pytest.param(
+        "create_branch",
+        "create_branch",
+        {"branch_name": "test-cases/issue-42", "base_branch": "main"},
+        id="create_branch"
+    ),
+    pytest.param(
+        "commit_file",
+        "create_or_update_file",
+        {
+            "file_path": "test-cases/issue-42.md",
+            "content": "# Test Cases\n\nTest content",
+            "branch_name": "test-cases/issue-42",
+            "commit_message": "Add test cases for issue #42"
+        },
+        id="commit_file"
+    ),
+    pytest.param(
+        "add_comment",
+        "add_issue_comment",
+        {
+            "issue_number": 42,
+            "comment": "✅ Test cases generated! View PR: https://github.com/owner/repo/pull/123"
+        },
+        id="add_comment"
+    ),
+]
+
+
+# Issue-derived names: (GitHubService method, expected value for issue #42)
+NAMING_CASES = [
+    pytest.param("generate_branch_name", "test-cases/issue-42", id="branch_name"),
+    pytest.param("generate_file_path", "test-cases/issue-42.md", id="file_path"),
+    pytest.param("generate_commit_message", "Add test cases for issue #42", id="commit_message"),
+]
 
 
 class TestGitHubServiceOperations:
@@ -14,44 +55,39 @@ class TestGitHubServiceOperations:
     @pytest.fixture
     def mock_github_client(self):
         """Fixture for mocked GitHubClient."""
-        mock_client = AsyncMock()
-        mock_client.get_repo = Mock(return_value=Mock())
-        return mock_client
+        return AsyncMock()
 
     @pytest.fixture
     def github_service(self, mock_github_client):
         """Fixture for GitHubService instance."""
-        mock_config = Mock()
-        mock_config.GITHUB_TOKEN = "test_token"
-        mock_config.GITHUB_REPO = "owner/repo"
+        mock_config = SimpleNamespace(GITHUB_TOKEN="test_token", GITHUB_REPO="owner/repo")
 
         return GitHubService(
             github_client=mock_github_client,
             config=mock_config
         )
 
-    @pytest.mark.asyncio
-    async def test_create_branch_success(self, github_service, mock_github_client):
-        """Test create_branch() successfully creates a new branch."""
-        branch_name = "test-cases/issue-42"
-        base_branch = "main"
-
-        # Mock branch creation
-        mock_github_client.create_branch = AsyncMock()
+    @pytest.mark.asyncio(loop_scope="module")
+    @pytest.mark.parametrize(("service_method", "client_method", "kwargs"), PASSTHROUGH_CASES)
+    async def test_passthrough_success(
+        self,
+        github_service,
+        mock_github_client,
+        service_method,
+        client_method,
+        kwargs
+    ):
+        """Test create_branch(), commit_file() and add_comment() forward to the client."""
+        # Mock the client call
+        setattr(mock_github_client, client_method, AsyncMock())
 
         # Execute
-        await github_service.create_branch(
-            branch_name=branch_name,
-            base_branch=base_branch
-        )
+        await getattr(github_service, service_method)(**kwargs)
 
-        # Verify branch created
-        mock_github_client.create_branch.assert_called_once_with(
-            branch_name=branch_name,
-            base_branch=base_branch
-        )
+        # Verify the client received the same arguments
+        getattr(mock_github_client, client_method).assert_called_once_with(**kwargs)
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_create_branch_already_exists(self, github_service, mock_github_client):
         """Test create_branch() raises GitHubBranchExistsError (E402) if branch exists."""
         branch_name = "test-cases/issue-42"
@@ -68,34 +104,7 @@ class TestGitHubServiceOperations:
         assert exc_info.value.error_code == "E402"
         assert branch_name in str(exc_info.value)
 
-    @pytest.mark.asyncio
-    async def test_commit_file_success(self, github_service, mock_github_client):
-        """Test commit_file() successfully commits file to branch."""
-        file_path = "test-cases/issue-42.md"
-        content = "# Test Cases\n\nTest content"
-        branch_name = "test-cases/issue-42"
-        commit_message = "Add test cases for issue #42"
-
-        # Mock file commit
-        mock_github_client.create_or_update_file = AsyncMock()
-
-        # Execute
-        await github_service.commit_file(
-            file_path=file_path,
-            content=content,
-            branch_name=branch_name,
-            commit_message=commit_message
-        )
-
-        # Verify file committed
-        mock_github_client.create_or_update_file.assert_called_once_with(
-            file_path=file_path,
-            content=content,
-            branch_name=branch_name,
-            commit_message=commit_message
-        )
-
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_commit_file_update_existing(self, github_service, mock_github_client):
         """Test commit_file() updates existing file."""
         file_path = "test-cases/issue-42.md"
@@ -116,7 +125,7 @@ class TestGitHubServiceOperations:
         # Verify update called
         mock_github_client.create_or_update_file.assert_called_once()
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_create_pr_success(self, github_service, mock_github_client):
         """Test create_pr() successfully creates pull request."""
         title = "Test Cases: Add Authentication"
@@ -129,7 +138,7 @@ class TestGitHubServiceOperations:
             "number": 123,
             "html_url": "https://github.com/owner/repo/pull/123",
             "state": "open",
-            "created_at": datetime.now().isoformat()
+            "created_at": FROZEN_NOW.isoformat()
         }
         mock_github_client.create_pull_request = AsyncMock(return_value=mock_pr)
 
@@ -153,7 +162,7 @@ class TestGitHubServiceOperations:
         assert pr_data["number"] == 123
         assert pr_data["html_url"] == "https://github.com/owner/repo/pull/123"
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_create_pr_includes_issue_reference(self, github_service, mock_github_client):
         """Test create_pr() body includes 'Closes #N' reference."""
         issue_number = 42
@@ -174,28 +183,69 @@ class TestGitHubServiceOperations:
         body = call_args.kwargs.get("body", "")
         assert f"Closes #{issue_number}" in body
 
-    @pytest.mark.asyncio
-    async def test_add_comment_success(self, github_service, mock_github_client):
-        """Test add_comment() successfully adds comment to issue."""
-        issue_number = 42
-        comment = "✅ Test cases generated! View PR: https://github.com/owner/repo/pull/123"
-
-        # Mock comment creation
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_commit_and_comment(self, github_service, mock_github_client):
+        """Test commit_and_comment() commits the file and comments on the issue."""
+        mock_github_client.create_or_update_file = AsyncMock()
         mock_github_client.add_issue_comment = AsyncMock()
 
         # Execute
-        await github_service.add_comment(
-            issue_number=issue_number,
-            comment=comment
+        await github_service.commit_and_comment(
+            file_path="test-cases/issue-42.md",
+            content="# Test Cases",
+            branch_name="test-cases/issue-42",
+            commit_message="Add test cases for issue #42",
+            issue_number=42,
+            comment="Generating test cases..."
         )
 
-        # Verify comment added
+        # Verify both requests issued
+        mock_github_client.create_or_update_file.assert_called_once_with(
+            file_path="test-cases/issue-42.md",
+            content="# Test Cases",
+            branch_name="test-cases/issue-42",
+            commit_message="Add test cases for issue #42"
+        )
         mock_github_client.add_issue_comment.assert_called_once_with(
-            issue_number=issue_number,
-            comment=comment
+            issue_number=42,
+            comment="Generating test cases..."
         )
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_commit_and_comment_cancels_comment_on_commit_failure(
+        self,
+        github_service,
+        mock_github_client
+    ):
+        """Test a failed commit cancels the in-flight issue comment and raises GitHubAPIError."""
+        comment_cancelled = False
+
+        async def slow_comment(*args, **kwargs):
+            nonlocal comment_cancelled
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                comment_cancelled = True
+                raise
+
+        mock_github_client.create_or_update_file = AsyncMock(side_effect=Exception("Conflict"))
+        mock_github_client.add_issue_comment = slow_comment
+
+        with pytest.raises(GitHubAPIError) as exc_info:
+            await github_service.commit_and_comment(
+                file_path="test-cases/issue-42.md",
+                content="# Test Cases",
+                branch_name="test-cases/issue-42",
+                commit_message="Add test cases for issue #42",
+                issue_number=42,
+                comment="Generating test cases..."
+            )
+
+        assert comment_cancelled is True
+        # The task group stays attached for any further failures
+        assert isinstance(exc_info.value.__cause__, ExceptionGroup)
+
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_rate_limit_error_handling(self, github_service, mock_github_client):
         """Test GitHubRateLimitError (E405) is raised when rate limit exceeded."""
         # Mock rate limit error
@@ -213,7 +263,7 @@ class TestGitHubServiceOperations:
         assert exc_info.value.error_code == "E405"
         assert "rate limit" in str(exc_info.value).lower()
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_api_error_handling(self, github_service, mock_github_client):
         """Test GitHubAPIError (E406) is raised for generic API errors."""
         # Mock API error
@@ -235,20 +285,12 @@ class TestGitHubServiceOperations:
 
         assert exc_info.value.error_code == "E406"
 
-    @pytest.mark.asyncio
-    async def test_branch_name_validation(self, github_service):
-        """Test branch name follows pattern 'test-cases/issue-{number}'."""
-        issue_number = 42
-
-        # Generate branch name
-        branch_name = github_service.generate_branch_name(issue_number)
-
-        # Verify pattern
-        assert branch_name == "test-cases/issue-42"
-        assert branch_name.startswith("test-cases/issue-")
+    @pytest.mark.parametrize(("method", "expected"), NAMING_CASES)
+    def test_issue_naming(self, github_service, method, expected):
+        """Test branch name, file path and commit message generated for issue #42."""
+        assert getattr(github_service, method)(42) == expected
 
-    @pytest.mark.asyncio
-    async def test_pr_body_formatting(self, github_service):
+    def test_pr_body_formatting(self, github_service):
         """Test PR body includes issue reference and generated content."""
         issue_number = 42
         issue_title = "Add authentication"
@@ -265,8 +307,13 @@ class TestGitHubServiceOperations:
         assert issue_title in pr_body
         assert "38" in pr_body  # Context sources included
 
-    @pytest.mark.asyncio
-    async def test_retry_on_transient_errors(self, github_service, mock_github_client):
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_retry_on_transient_errors(
+        self,
+        github_service,
+        mock_github_client,
+        recorded_sleeps
+    ):
         """Test operations retry on transient GitHub API errors."""
         # Mock transient error followed by success
         call_count = 0
@@ -286,13 +333,12 @@ class TestGitHubServiceOperations:
         )
 
         assert call_count == 2  # Failed once, succeeded second time
+        assert recorded_sleeps == [1]  # 2 ** 0 backoff before the second attempt
 
-    @pytest.mark.asyncio
-    async def test_get_default_branch(self, github_service, mock_github_client):
+    def test_get_default_branch(self, github_service, mock_github_client):
         """Test getting repository default branch (main or master)."""
         # Mock repository with default branch
-        mock_repo = Mock()
-        mock_repo.default_branch = "main"
+        mock_repo = SimpleNamespace(default_branch="main")
         mock_github_client.get_repo = Mock(return_value=mock_repo)
 
         # Get default branch
@@ -300,13 +346,10 @@ class TestGitHubServiceOperations:
 
         assert default_branch == "main"
 
-    @pytest.mark.asyncio
-    async def test_validate_permissions(self, github_service, mock_github_client):
+    def test_validate_permissions(self, github_service, mock_github_client):
         """Test validating GitHub token has required permissions."""
         # Mock permissions check
-        mock_repo = Mock()
-        mock_repo.permissions.push = True
-        mock_repo.permissions.pull = True
+        mock_repo = SimpleNamespace(permissions=SimpleNamespace(push=True, pull=True))
         mock_github_client.get_repo = Mock(return_value=mock_repo)
 
         # Should validate successfully
@@ -314,31 +357,21 @@ class TestGitHubServiceOperations:
 
         assert has_permissions is True
 
-    @pytest.mark.asyncio
-    async def test_file_path_generation(self, github_service):
-        """Test generating file path for test case document."""
-        issue_number = 42
-
-        # Generate file path
-        file_path = github_service.generate_file_path(issue_number)
-
-        # Verify pattern
-        assert file_path == f"test-cases/issue-{issue_number}.md"
-        assert file_path.endswith(".md")
-
-    @pytest.mark.asyncio
-    async def test_commit_message_formatting(self, github_service):
-        """Test commit message includes issue reference."""
-        issue_number = 42
+    def test_repo_fetched_once_by_name(self, github_service, mock_github_client):
+        """Test the configured repository is fetched by name once and reused."""
+        mock_repo = SimpleNamespace(
+            default_branch="main",
+            permissions=SimpleNamespace(push=True, pull=True)
+        )
+        mock_github_client.get_repo = Mock(return_value=mock_repo)
 
-        # Generate commit message
-        commit_message = github_service.generate_commit_message(issue_number)
+        # Both lookups read the same cached repository
+        assert github_service.get_default_branch() == "main"
+        assert github_service.validate_permissions() is True
 
-        # Verify format
-        assert f"#{issue_number}" in commit_message
-        assert "test case" in commit_message.lower()
+        mock_github_client.get_repo.assert_called_once_with("owner/repo")
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_concurrent_pr_creation(self, github_service, mock_github_client):
         """Test service handles concurrent PR creations safely."""
         # Mock multiple PR creations
@@ -350,11 +383,11 @@ class TestGitHubServiceOperations:
         )
 
         # Create multiple PRs concurrently
-        import asyncio
-        pr1_task = github_service.create_pr("Title 1", "Body 1", "branch-1", "main")
-        pr2_task = github_service.create_pr("Title 2", "Body 2", "branch-2", "main")
+        async with asyncio.TaskGroup() as tg:
+            pr1_task = tg.create_task(github_service.create_pr("Title 1", "Body 1", "branch-1", "main"))
+            pr2_task = tg.create_task(github_service.create_pr("Title 2", "Body 2", "branch-2", "main"))
 
-        pr1, pr2 = await asyncio.gather(pr1_task, pr2_task)
+        pr1, pr2 = pr1_task.result(), pr2_task.result()
 
         # Verify both created with unique numbers
         assert pr1["number"] == 123
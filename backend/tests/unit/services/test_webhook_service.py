@@ -1,6 +1,9 @@
 """Unit tests for WebhookService."""
 import hashlib
 import hmac
+import json
+import uuid
+from types import MappingProxyType
 from unittest.mock import AsyncMock, Mock
 
 import pytest
@@ -12,6 +15,79 @@ from src.core.exceptions import (
 )
 from src.services.webhook_service import WebhookService
 
+# Secret shared by the service under test and every signed payload
+WEBHOOK_SECRET = "test_webhook_secret_key_12345"
+
+# HMAC keyed once with the secret; each signature copies it instead of re-keying
+HMAC_TEMPLATE = hmac.new(WEBHOOK_SECRET.encode('utf-8'), b'', hashlib.sha256)
+
+
+def sign_payload(payload: bytes) -> str:
+    """Sign a payload the way GitHub does for the X-Hub-Signature-256 header.
+
+    Args:
+        payload: Raw request body bytes
+
+    Returns:
+        Signature header value in format 'sha256={hexdigest}'
+    """
+    mac = HMAC_TEMPLATE.copy()
+    mac.update(payload)
+    return f"sha256={mac.hexdigest()}"
+
+
+# Valid GitHub 'issues' webhook payload (read-only)
+VALID_WEBHOOK_PAYLOAD = MappingProxyType({
+    "action": "opened",
+    "issue": {
+        "number": 42,
+        "title": "Add OAuth2 authentication feature",
+        "body": "Implement OAuth2 authentication with Google provider.",
+        "labels": [
+            {"name": "generate-tests"},
+            {"name": "enhancement"}
+        ]
+    },
+    "repository": {
+        "full_name": "owner/repo"
+    }
+})
+
+# Valid payload serialized and signed once for every test that sends it as-is
+VALID_PAYLOAD_BYTES = json.dumps(dict(VALID_WEBHOOK_PAYLOAD)).encode('utf-8')
+VALID_SIGNATURE = sign_payload(VALID_PAYLOAD_BYTES)
+
+# Valid payload without the 'generate-tests' label, serialized and signed once
+UNLABELED_PAYLOAD_BYTES = json.dumps({
+    **VALID_WEBHOOK_PAYLOAD,
+    "issue": {**VALID_WEBHOOK_PAYLOAD["issue"], "labels": [{"name": "enhancement"}]}
+}).encode('utf-8')
+UNLABELED_SIGNATURE = sign_payload(UNLABELED_PAYLOAD_BYTES)
+
+# Idempotency key for the valid payload: SHA256 of '{repository}-{issue_number}'
+VALID_IDEMPOTENCY_KEY = hashlib.sha256(b"owner/repo-42").hexdigest()
+
+# Signature headers not in 'sha256={64-char lowercase hex}' format
+MALFORMED_SIGNATURES = [
+    "invalid_format",
+    "sha1=abc123",
+    "abc123",
+    "",
+    "sha256=invalid_signature_hash_12345",
+    "sha256=" + "A" * 64,  # Uppercase hex: GitHub always sends lowercase
+]
+
+# Well-formed 64-char lowercase hex digest that does not match any test payload
+MISMATCHED_SIGNATURE = "sha256=" + "0" * 64
+
+# Payloads missing required fields
+MALFORMED_PAYLOADS = [
+    pytest.param({}, id="empty"),
+    pytest.param({"action": "opened"}, id="missing_issue"),
+    pytest.param({"issue": {"number": 42}}, id="missing_repository"),
+    pytest.param({"issue": {}, "repository": {}}, id="missing_nested_fields"),
+]
+
 
 class TestWebhookServiceValidation:
     """Test WebhookService signature validation and event processing."""
@@ -19,7 +95,7 @@ class TestWebhookServiceValidation:
     @pytest.fixture
     def webhook_secret(self):
         """Fixture for webhook secret."""
-        return "test_webhook_secret_key_12345"
+        return WEBHOOK_SECRET
 
     @pytest.fixture
     def webhook_service(self, webhook_secret):
@@ -35,139 +111,65 @@ class TestWebhookServiceValidation:
 
         return WebhookService(redis_client=mock_redis, config=mock_config)
 
-    @pytest.fixture
-    def valid_webhook_payload(self):
-        """Fixture for valid GitHub webhook payload."""
-        return {
-            "action": "opened",
-            "issue": {
-                "number": 42,
-                "title": "Add OAuth2 authentication feature",
-                "body": "Implement OAuth2 authentication with Google provider.",
-                "labels": [
-                    {"name": "generate-tests"},
-                    {"name": "enhancement"}
-                ]
-            },
-            "repository": {
-                "full_name": "owner/repo"
-            }
-        }
-
-    def test_valid_signature_validation(self, webhook_service, webhook_secret, valid_webhook_payload):
+    def test_valid_signature_validation(self, webhook_service):
         """Test HMAC-SHA256 signature validation accepts valid signature."""
-        import json
-
-        # Generate valid signature
-        payload_bytes = json.dumps(valid_webhook_payload).encode('utf-8')
-        expected_signature = hmac.new(
-            webhook_secret.encode('utf-8'),
-            payload_bytes,
-            hashlib.sha256
-        ).hexdigest()
-        signature_header = f"sha256={expected_signature}"
-
         # Should not raise exception
         is_valid = webhook_service.validate_signature(
-            payload=payload_bytes,
-            signature=signature_header
+            payload=VALID_PAYLOAD_BYTES,
+            signature=VALID_SIGNATURE
         )
 
         assert is_valid is True
 
-    def test_invalid_signature_rejected(self, webhook_service, valid_webhook_payload):
-        """Test invalid signature is rejected with InvalidWebhookSignatureError."""
-        import json
-
-        payload_bytes = json.dumps(valid_webhook_payload).encode('utf-8')
-        invalid_signature = "sha256=invalid_signature_hash_12345"
-
-        # Should raise InvalidWebhookSignatureError (E101)
+    def test_invalid_signature_rejected(self, webhook_service):
+        """Test well-formed signature that does not match is rejected with InvalidWebhookSignatureError."""
+        # Should raise InvalidWebhookSignatureError (E101) from the digest comparison
         with pytest.raises(InvalidWebhookSignatureError) as exc_info:
             webhook_service.validate_signature(
-                payload=payload_bytes,
-                signature=invalid_signature
+                payload=VALID_PAYLOAD_BYTES,
+                signature=MISMATCHED_SIGNATURE
             )
 
         assert exc_info.value.error_code == "E101"
+        # Reported expected value is the computed digest, not the format hint
+        assert exc_info.value.details["expected"] == VALID_SIGNATURE[len("sha256="):][:10] + "..."
 
-    def test_missing_signature_rejected(self, webhook_service, valid_webhook_payload):
+    def test_missing_signature_rejected(self, webhook_service):
         """Test missing signature header is rejected."""
-        import json
-
-        payload_bytes = json.dumps(valid_webhook_payload).encode('utf-8')
-
         with pytest.raises(InvalidWebhookSignatureError) as exc_info:
             webhook_service.validate_signature(
-                payload=payload_bytes,
+                payload=VALID_PAYLOAD_BYTES,
                 signature=None
             )
 
         assert exc_info.value.error_code == "E101"
 
-    def test_malformed_signature_format(self, webhook_service, valid_webhook_payload):
-        """Test signature without 'sha256=' prefix is rejected."""
-        import json
-
-        payload_bytes = json.dumps(valid_webhook_payload).encode('utf-8')
-        malformed_signatures = [
-            "invalid_format",
-            "sha1=abc123",
-            "abc123",
-            ""
-        ]
-
-        for malformed in malformed_signatures:
-            with pytest.raises(InvalidWebhookSignatureError):
-                webhook_service.validate_signature(
-                    payload=payload_bytes,
-                    signature=malformed
-                )
+    @pytest.mark.parametrize("malformed", MALFORMED_SIGNATURES)
+    def test_malformed_signature_format(self, webhook_service, malformed):
+        """Test the service rejects malformed signature headers."""
+        with pytest.raises(InvalidWebhookSignatureError):
+            webhook_service.validate_signature(
+                payload=VALID_PAYLOAD_BYTES,
+                signature=malformed
+            )
 
     @pytest.mark.asyncio
-    async def test_generate_tests_tag_required(self, webhook_service, valid_webhook_payload, webhook_secret):
+    async def test_generate_tests_tag_required(self, webhook_service):
         """Test 'generate-tests' label is required (FR-002)."""
-        import json
-
-        # Valid payload with generate-tests label
-        payload_bytes = json.dumps(valid_webhook_payload).encode('utf-8')
-        expected_signature = hmac.new(
-            webhook_secret.encode('utf-8'),
-            payload_bytes,
-            hashlib.sha256
-        ).hexdigest()
-        signature_header = f"sha256={expected_signature}"
-
-        # Should process successfully
+        # Valid payload with generate-tests label should process successfully
         webhook_event = await webhook_service.process_webhook(
-            payload=payload_bytes,
-            signature=signature_header,
+            payload=VALID_PAYLOAD_BYTES,
+            signature=VALID_SIGNATURE,
             event_type="issues.opened"
         )
 
         assert "generate-tests" in webhook_event.labels
 
-        # Invalid: Missing generate-tests label
-        invalid_payload = {
-            **valid_webhook_payload,
-            "issue": {
-                **valid_webhook_payload["issue"],
-                "labels": [{"name": "enhancement"}]
-            }
-        }
-
-        invalid_bytes = json.dumps(invalid_payload).encode('utf-8')
-        invalid_signature = hmac.new(
-            webhook_secret.encode('utf-8'),
-            invalid_bytes,
-            hashlib.sha256
-        ).hexdigest()
-
-        # Should raise InvalidWebhookPayloadError (E103)
+        # Invalid: Missing generate-tests label should raise InvalidWebhookPayloadError (E103)
         with pytest.raises(InvalidWebhookPayloadError) as exc_info:
             await webhook_service.process_webhook(
-                payload=invalid_bytes,
-                signature=f"sha256={invalid_signature}",
+                payload=UNLABELED_PAYLOAD_BYTES,
+                signature=UNLABELED_SIGNATURE,
                 event_type="issues.opened"
             )
 
@@ -175,51 +177,48 @@ class TestWebhookServiceValidation:
         assert "generate-tests" in str(exc_info.value)
 
     @pytest.mark.asyncio
-    async def test_duplicate_webhook_detection(self, webhook_service, valid_webhook_payload, webhook_secret):
+    async def test_duplicate_webhook_detection(self, webhook_service):
         """Test duplicate webhook is detected via idempotency key (FR-017)."""
-        import json
-
-        payload_bytes = json.dumps(valid_webhook_payload).encode('utf-8')
-        expected_signature = hmac.new(
-            webhook_secret.encode('utf-8'),
-            payload_bytes,
-            hashlib.sha256
-        ).hexdigest()
-        signature_header = f"sha256={expected_signature}"
-
         # Mock Redis to return existing idempotency key
-        webhook_service.redis_client.exists = AsyncMock(return_value=True)
+        webhook_service.redis_client.exists.return_value = True
 
         # Should raise DuplicateWebhookError (E104)
         with pytest.raises(DuplicateWebhookError) as exc_info:
             await webhook_service.process_webhook(
-                payload=payload_bytes,
-                signature=signature_header,
+                payload=VALID_PAYLOAD_BYTES,
+                signature=VALID_SIGNATURE,
                 event_type="issues.opened"
             )
 
         assert exc_info.value.error_code == "E104"
 
     @pytest.mark.asyncio
-    async def test_event_parsing_from_payload(self, webhook_service, valid_webhook_payload, webhook_secret):
-        """Test WebhookEvent is correctly parsed from GitHub payload."""
-        import json
+    async def test_repeated_delivery_skips_redis(self, webhook_service):
+        """Test a repeated delivery is rejected from the in-process cache without a Redis lookup."""
+        # First delivery is accepted
+        await webhook_service.process_webhook(
+            payload=VALID_PAYLOAD_BYTES,
+            signature=VALID_SIGNATURE,
+            event_type="issues.opened"
+        )
 
-        payload_bytes = json.dumps(valid_webhook_payload).encode('utf-8')
-        expected_signature = hmac.new(
-            webhook_secret.encode('utf-8'),
-            payload_bytes,
-            hashlib.sha256
-        ).hexdigest()
-        signature_header = f"sha256={expected_signature}"
+        # Redelivery is rejected (E104) before reaching Redis
+        with pytest.raises(DuplicateWebhookError) as exc_info:
+            await webhook_service.process_webhook(
+                payload=VALID_PAYLOAD_BYTES,
+                signature=VALID_SIGNATURE,
+                event_type="issues.opened"
+            )
 
-        # Mock Redis to allow processing
-        webhook_service.redis_client.exists = AsyncMock(return_value=False)
-        webhook_service.redis_client.set_with_ttl = AsyncMock()
+        assert exc_info.value.error_code == "E104"
+        webhook_service.redis_client.exists.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_event_parsing_from_payload(self, webhook_service):
+        """Test WebhookEvent is correctly parsed from GitHub payload."""
         webhook_event = await webhook_service.process_webhook(
-            payload=payload_bytes,
-            signature=signature_header,
+            payload=VALID_PAYLOAD_BYTES,
+            signature=VALID_SIGNATURE,
             event_type="issues.opened"
         )
 
@@ -231,123 +230,62 @@ class TestWebhookServiceValidation:
         assert "generate-tests" in webhook_event.labels
 
     @pytest.mark.asyncio
-    async def test_event_type_validation(self, webhook_service, valid_webhook_payload, webhook_secret):
-        """Test only 'issues.opened' and 'issues.labeled' event types are accepted."""
-        import json
-
-        payload_bytes = json.dumps(valid_webhook_payload).encode('utf-8')
-        expected_signature = hmac.new(
-            webhook_secret.encode('utf-8'),
-            payload_bytes,
-            hashlib.sha256
-        ).hexdigest()
-        signature_header = f"sha256={expected_signature}"
-
-        # Mock Redis
-        webhook_service.redis_client.exists = AsyncMock(return_value=False)
-        webhook_service.redis_client.set_with_ttl = AsyncMock()
-
-        # Valid event types
-        valid_types = ["issues.opened", "issues.labeled"]
-        for event_type in valid_types:
-            webhook_event = await webhook_service.process_webhook(
-                payload=payload_bytes,
-                signature=signature_header,
-                event_type=event_type
-            )
-            assert webhook_event.event_type == event_type
+    @pytest.mark.parametrize("event_type", ["issues.opened", "issues.labeled"])
+    async def test_event_type_validation_valid(self, webhook_service, event_type):
+        """Test 'issues.opened' and 'issues.labeled' event types are accepted."""
+        webhook_event = await webhook_service.process_webhook(
+            payload=VALID_PAYLOAD_BYTES,
+            signature=VALID_SIGNATURE,
+            event_type=event_type
+        )
+
+        assert webhook_event.event_type == event_type
 
-        # Invalid event type
+    @pytest.mark.asyncio
+    async def test_event_type_validation_invalid(self, webhook_service):
+        """Test event types other than 'issues.opened' and 'issues.labeled' are rejected."""
         with pytest.raises(InvalidWebhookPayloadError):
             await webhook_service.process_webhook(
-                payload=payload_bytes,
-                signature=signature_header,
+                payload=VALID_PAYLOAD_BYTES,
+                signature=VALID_SIGNATURE,
                 event_type="issues.closed"
             )
 
     @pytest.mark.asyncio
-    async def test_idempotency_key_generation(self, webhook_service, valid_webhook_payload, webhook_secret):
+    async def test_idempotency_key_generation(self, webhook_service):
         """Test idempotency key is SHA256 hash of (repository + issue_number)."""
-        import json
-
-        payload_bytes = json.dumps(valid_webhook_payload).encode('utf-8')
-        expected_signature = hmac.new(
-            webhook_secret.encode('utf-8'),
-            payload_bytes,
-            hashlib.sha256
-        ).hexdigest()
-        signature_header = f"sha256={expected_signature}"
-
-        # Mock Redis
-        webhook_service.redis_client.exists = AsyncMock(return_value=False)
-        webhook_service.redis_client.set_with_ttl = AsyncMock()
-
         webhook_event = await webhook_service.process_webhook(
-            payload=payload_bytes,
-            signature=signature_header,
+            payload=VALID_PAYLOAD_BYTES,
+            signature=VALID_SIGNATURE,
             event_type="issues.opened"
         )
 
-        # Calculate expected idempotency key
-        key_string = f"{valid_webhook_payload['repository']['full_name']}-{valid_webhook_payload['issue']['number']}"
-        expected_key = hashlib.sha256(key_string.encode('utf-8')).hexdigest()
-
         # Verify Redis set_with_ttl was called with correct key
         webhook_service.redis_client.set_with_ttl.assert_called_once()
         call_args = webhook_service.redis_client.set_with_ttl.call_args[0]
-        assert expected_key in call_args[0]  # Key contains hash
+        assert VALID_IDEMPOTENCY_KEY in call_args[0]  # Key contains hash
 
     @pytest.mark.asyncio
-    async def test_malformed_payload_rejected(self, webhook_service, webhook_secret):
+    @pytest.mark.parametrize("malformed", MALFORMED_PAYLOADS)
+    async def test_malformed_payload_rejected(self, webhook_service, malformed):
         """Test malformed JSON payload is rejected."""
-        # Missing required fields
-        malformed_payloads = [
-            {},  # Empty
-            {"action": "opened"},  # Missing issue
-            {"issue": {"number": 42}},  # Missing repository
-            {"issue": {}, "repository": {}},  # Missing fields in nested objects
-        ]
+        payload_bytes = json.dumps(malformed).encode('utf-8')
 
-        for malformed in malformed_payloads:
-            import json
-            payload_bytes = json.dumps(malformed).encode('utf-8')
-            expected_signature = hmac.new(
-                webhook_secret.encode('utf-8'),
-                payload_bytes,
-                hashlib.sha256
-            ).hexdigest()
-            signature_header = f"sha256={expected_signature}"
-
-            with pytest.raises(InvalidWebhookPayloadError):
-                await webhook_service.process_webhook(
-                    payload=payload_bytes,
-                    signature=signature_header,
-                    event_type="issues.opened"
-                )
+        with pytest.raises(InvalidWebhookPayloadError):
+            await webhook_service.process_webhook(
+                payload=payload_bytes,
+                signature=sign_payload(payload_bytes),
+                event_type="issues.opened"
+            )
 
     @pytest.mark.asyncio
-    async def test_correlation_id_generation(self, webhook_service, valid_webhook_payload, webhook_secret):
+    async def test_correlation_id_generation(self, webhook_service):
         """Test correlation ID is generated for each webhook event."""
-        import json
-
-        payload_bytes = json.dumps(valid_webhook_payload).encode('utf-8')
-        expected_signature = hmac.new(
-            webhook_secret.encode('utf-8'),
-            payload_bytes,
-            hashlib.sha256
-        ).hexdigest()
-        signature_header = f"sha256={expected_signature}"
-
-        # Mock Redis
-        webhook_service.redis_client.exists = AsyncMock(return_value=False)
-        webhook_service.redis_client.set_with_ttl = AsyncMock()
-
         webhook_event = await webhook_service.process_webhook(
-            payload=payload_bytes,
-            signature=signature_header,
+            payload=VALID_PAYLOAD_BYTES,
+            signature=VALID_SIGNATURE,
             event_type="issues.opened"
         )
 
         # Verify correlation_id is a valid UUID
-        import uuid
         assert uuid.UUID(webhook_event.correlation_id)